@@ -9,19 +9,60 @@ Usage:
     # Test Coinbase
     CDP_API_KEY_ID=xxx CDP_API_KEY_SECRET=xxx CDP_WALLET_SECRET=xxx \
         python scripts/test_providers.py --provider coinbase
+
+If uvloop is installed (pip install paykit[fast]), it is used as the
+event loop.
 """
 
 import asyncio
 import argparse
+import contextlib
+import functools
+import io
 import os
 import sys
+import traceback
 from decimal import Decimal
 
 # Add src to path for development
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
 
+# Number of wallets whose balances are fetched concurrently
+BALANCE_SAMPLE_SIZE = 3
+
+
+@contextlib.contextmanager
+def buffered_section():
+    """Collect a section's output and write it to stdout in a single call."""
+    buffer = io.StringIO()
+    stdout = sys.stdout
+    try:
+        with contextlib.redirect_stdout(buffer):
+            yield
+    finally:
+        stdout.write(buffer.getvalue())
+        stdout.flush()
+
 
-async def test_circle_provider():
+def report_errors(fn):
+    """Turn an uncaught exception in a test section into a failed result.
+
+    Tracebacks are only printed when PAYKIT_DEBUG is set.
+    """
+    @functools.wraps(fn)
+    async def wrapper(*args, **kwargs):
+        try:
+            return await fn(*args, **kwargs)
+        except Exception as e:
+            print(f"\n❌ {fn.__name__}: {e}")
+            if os.environ.get("PAYKIT_DEBUG"):
+                traceback.print_exc()
+            return False
+    return wrapper
+
+
+@report_errors
+async def test_circle_provider(provider=None):
     """Test Circle provider functionality."""
     print("\n" + "=" * 60)
     print("Testing Circle Provider")
@@ -36,47 +77,42 @@ async def test_circle_provider():
     
     print(f"✓ API Key found: {api_key[:8]}...")
     
-    try:
-        from paykit import PayKit, Network
-        
-        # Initialize client
-        print("\n1. Initializing PayKit client...")
-        client = PayKit(network=Network.ARC_TESTNET)
-        print("   ✓ Client initialized")
-        
-        # List wallet sets
-        print("\n2. Listing wallet sets...")
-        wallet_sets = client.wallet.list_wallet_sets()
-        print(f"   ✓ Found {len(wallet_sets)} wallet sets")
-        for ws in wallet_sets[:3]:
-            print(f"      - {ws.name} ({ws.id})")
-        
-        # List wallets
-        print("\n3. Listing wallets...")
-        wallets = client.wallet.list_wallets()
-        print(f"   ✓ Found {len(wallets)} wallets")
-        for w in wallets[:3]:
-            print(f"      - {w.address[:20]}... ({w.blockchain})")
-        
-        # Check balance (if wallets exist)
-        if wallets:
-            print("\n4. Checking balance...")
-            wallet = wallets[0]
-            balance = client.wallet.get_usdc_balance_amount(wallet.id)
-            print(f"   ✓ Balance: {balance} USDC")
-        
-        print("\n" + "=" * 60)
-        print("✓ Circle Provider: ALL TESTS PASSED")
-        print("=" * 60)
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
+    # The provider is created once in main() and shared with the other
+    # sections; every call below goes through it
+    print("\n1. Checking Circle provider...")
+    if provider is None:
+        print("   ❌ Circle provider could not be created")
         return False
+    print(f"   ✓ Provider ready: {provider.provider_type.value}")
+    
+    # List wallet sets and wallets concurrently (independent calls)
+    print("\n2. Listing wallet sets and wallets...")
+    wallet_sets, wallets = await asyncio.gather(
+        provider.list_wallet_sets(),
+        provider.list_wallets(),
+    )
+    print(f"   ✓ Found {len(wallet_sets)} wallet sets")
+    for ws in wallet_sets[:3]:
+        print(f"      - {ws.name} ({ws.id})")
+    print(f"   ✓ Found {len(wallets)} wallets")
+    for w in wallets[:3]:
+        print(f"      - {w.address[:20]}... ({w.blockchain})")
+    
+    # Check balances (if wallets exist)
+    if wallets:
+        print("\n3. Checking balances...")
+        sample = wallets[:BALANCE_SAMPLE_SIZE]
+        balances = await provider.get_usdc_balance_many([w.id for w in sample])
+        for w, balance in zip(sample, balances, strict=True):
+            print(f"   ✓ {w.id}: {balance} USDC")
+    
+    print("\n" + "=" * 60)
+    print("✓ Circle Provider: ALL TESTS PASSED")
+    print("=" * 60)
+    return True
 
 
+@report_errors
 async def test_coinbase_provider():
     """Test Coinbase provider functionality."""
     print("\n" + "=" * 60)
@@ -88,7 +124,7 @@ async def test_coinbase_provider():
     api_key_secret = os.environ.get("CDP_API_KEY_SECRET")
     wallet_secret = os.environ.get("CDP_WALLET_SECRET")
     
-    if not all([api_key_id, api_key_secret, wallet_secret]):
+    if not (api_key_id and api_key_secret and wallet_secret):
         print("❌ Coinbase credentials not set")
         print("   Set them with:")
         print("     export CDP_API_KEY_ID='your-api-key-id'")
@@ -98,17 +134,24 @@ async def test_coinbase_provider():
     
     print(f"✓ API Key ID found: {api_key_id[:8]}...")
     
-    try:
-        from paykit.providers import CoinbaseProvider, CoinbaseConfig
-        
-        # Initialize provider
-        print("\n1. Initializing Coinbase provider...")
-        config = CoinbaseConfig(
-            api_key=api_key_id,
-            api_secret=api_key_secret,
-            wallet_secret=wallet_secret,
-        )
-        provider = CoinbaseProvider(config)
+    from paykit.providers import CoinbaseProvider, CoinbaseConfig
+    from paykit.providers.coinbase import CDP_SDK_AVAILABLE
+    
+    if not CDP_SDK_AVAILABLE:
+        print("❌ cdp-sdk not installed")
+        print("   Install with: pip install paykit[coinbase]")
+        return False
+    
+    # Initialize provider
+    print("\n1. Initializing Coinbase provider...")
+    config = CoinbaseConfig(
+        api_key=api_key_id,
+        api_secret=api_key_secret,
+        wallet_secret=wallet_secret,
+    )
+    # The provider holds a CDP client session; closing it releases the
+    # underlying HTTP session
+    async with CoinbaseProvider(config) as provider:
         print("   ✓ Provider initialized")
         
         # Create wallet set
@@ -131,54 +174,39 @@ async def test_coinbase_provider():
         print(f"   ✓ Found {len(balances)} token balances")
         for b in balances:
             print(f"      - {b.token_symbol}: {b.amount}")
-        
-        print("\n" + "=" * 60)
-        print("✓ Coinbase Provider: ALL TESTS PASSED")
-        print("=" * 60)
-        return True
-        
-    except ImportError:
-        print("❌ cdp-sdk not installed")
-        print("   Install with: pip install paykit[coinbase]")
-        return False
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
-        import traceback
-        traceback.print_exc()
-        return False
+    
+    print("\n" + "=" * 60)
+    print("✓ Coinbase Provider: ALL TESTS PASSED")
+    print("=" * 60)
+    return True
 
 
-async def test_provider_abstraction():
+@report_errors
+async def test_provider_abstraction(circle_provider=None, circle_error=None):
     """Test the provider factory."""
     print("\n" + "=" * 60)
     print("Testing Provider Factory")
     print("=" * 60)
     
-    try:
-        from paykit.providers import get_provider, list_providers, ProviderType
-        
-        print("\n1. Listing available providers...")
-        providers = list_providers()
-        print(f"   ✓ Available: {[p.value for p in providers]}")
-        
-        print("\n2. Testing provider factory...")
-        
-        # Test Circle (if credentials available)
-        if os.environ.get("CIRCLE_API_KEY"):
-            try:
-                provider = get_provider(ProviderType.CIRCLE)
-                print(f"   ✓ Circle provider: {provider.provider_type.value}")
-            except Exception as e:
-                print(f"   ❌ Circle: {e}")
-        
-        print("\n" + "=" * 60)
-        print("✓ Provider Factory: TESTS PASSED")
-        print("=" * 60)
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Error: {e}")
+    from paykit.providers import list_providers
+    
+    print("\n1. Listing available providers...")
+    providers = list_providers()
+    print(f"   ✓ Available: {[p.value for p in providers]}")
+    
+    print("\n2. Testing provider factory...")
+    
+    # Test Circle (if credentials available)
+    if circle_provider is not None:
+        print(f"   ✓ Circle provider: {circle_provider.provider_type.value}")
+    elif circle_error is not None:
+        print(f"   ❌ Circle: {circle_error}")
         return False
+    
+    print("\n" + "=" * 60)
+    print("✓ Provider Factory: TESTS PASSED")
+    print("=" * 60)
+    return True
 
 
 async def main():
@@ -196,27 +224,57 @@ async def main():
     
     results = []
     
-    # Test provider factory
-    results.append(("Factory", await test_provider_abstraction()))
-    
-    # Test specific provider
-    if args.provider in ("circle", "all"):
-        results.append(("Circle", await test_circle_provider()))
-    
-    if args.provider in ("coinbase", "all"):
-        results.append(("Coinbase", await test_coinbase_provider()))
+    async with contextlib.AsyncExitStack() as stack:
+        # Create the Circle provider once; the factory and Circle sections
+        # both use it, and the exit stack closes it afterwards
+        circle_provider = None
+        circle_error = None
+        if os.environ.get("CIRCLE_API_KEY"):
+            try:
+                from paykit.providers import get_provider, ProviderType
+                circle_provider = await stack.enter_async_context(
+                    get_provider(ProviderType.CIRCLE)
+                )
+            except Exception as e:
+                # Reported by the factory section
+                circle_error = e
+        
+        # Test provider factory
+        with buffered_section():
+            factory_ok = await test_provider_abstraction(circle_provider, circle_error)
+            results.append(("Factory", factory_ok))
+        
+        # Test specific provider
+        if args.provider in ("circle", "all"):
+            with buffered_section():
+                results.append(("Circle", await test_circle_provider(circle_provider)))
+        
+        if args.provider in ("coinbase", "all"):
+            with buffered_section():
+                results.append(("Coinbase", await test_coinbase_provider()))
     
     # Summary
-    print("\n" + "=" * 60)
-    print("SUMMARY")
-    print("=" * 60)
-    for name, passed in results:
-        status = "✓ PASS" if passed else "❌ FAIL"
-        print(f"  {name}: {status}")
+    with buffered_section():
+        print("\n" + "=" * 60)
+        print("SUMMARY")
+        print("=" * 60)
+        for name, passed in results:
+            status = "✓ PASS" if passed else "❌ FAIL"
+            print(f"  {name}: {status}")
     
     all_passed = all(r[1] for r in results)
     sys.exit(0 if all_passed else 1)
 
 
+def install_uvloop():
+    """Use uvloop's event loop when it is available."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    uvloop.install()
+
+
 if __name__ == "__main__":
+    install_uvloop()
     asyncio.run(main())
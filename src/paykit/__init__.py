@@ -17,55 +17,122 @@ With Custom Provider:
     >>> client = PayKit(provider=provider)
 """
 
-from paykit.client import PayKit
-from paykit.core.config import Config
-from paykit.core.exceptions import (
-    ConfigurationError,
-    GuardError,
-    InsufficientBalanceError,
-    NetworkError,
-    PayKitError,
-    PaymentError,
-    ProtocolError,
-    WalletError,
-    X402Error,
-)
-from paykit.core.types import (
-    Balance,
-    FeeLevel,
-    Network,
-    PaymentMethod,
-    PaymentRequest,
-    PaymentResult,
-    PaymentStatus,
-    SimulationResult,
-    TokenInfo,
-    TransactionInfo,
-    WalletInfo,
-    WalletSetInfo,
-)
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from paykit.client import PayKit
+    from paykit.core.config import Config
+    from paykit.core.exceptions import (
+        ConfigurationError,
+        GuardError,
+        InsufficientBalanceError,
+        NetworkError,
+        PayKitError,
+        PaymentError,
+        ProtocolError,
+        WalletError,
+        X402Error,
+    )
+    from paykit.core.types import (
+        Balance,
+        FeeLevel,
+        Network,
+        PaymentMethod,
+        PaymentRequest,
+        PaymentResult,
+        PaymentStatus,
+        SimulationResult,
+        TokenInfo,
+        TransactionInfo,
+        WalletInfo,
+        WalletSetInfo,
+    )
+    from paykit.guards import (
+        BudgetGuard,
+        ConfirmGuard,
+        Guard,
+        GuardChain,
+        GuardResult,
+        PaymentContext,
+        RateLimitGuard,
+        RecipientGuard,
+        SingleTxGuard,
+    )
+    from paykit.onboarding import (
+        ensure_setup,
+        find_recovery_file,
+        generate_entity_secret,
+        get_config_dir,
+        print_setup_status,
+        quick_setup,
+        verify_setup,
+    )
+
+# Exports are imported on first access, so ``import paykit`` (and any
+# ``import paykit.<submodule>``) doesn't load the client, the Circle SDK
+# or the storage backends until they're used
+_LAZY: dict[str, str] = {
+    # Main Client
+    "PayKit": "paykit.client",
+    # Config
+    "Config": "paykit.core.config",
+    # Exceptions
+    "ConfigurationError": "paykit.core.exceptions",
+    "GuardError": "paykit.core.exceptions",
+    "InsufficientBalanceError": "paykit.core.exceptions",
+    "NetworkError": "paykit.core.exceptions",
+    "PayKitError": "paykit.core.exceptions",
+    "PaymentError": "paykit.core.exceptions",
+    "ProtocolError": "paykit.core.exceptions",
+    "WalletError": "paykit.core.exceptions",
+    "X402Error": "paykit.core.exceptions",
+    # Types
+    "Balance": "paykit.core.types",
+    "FeeLevel": "paykit.core.types",
+    "Network": "paykit.core.types",
+    "PaymentMethod": "paykit.core.types",
+    "PaymentRequest": "paykit.core.types",
+    "PaymentResult": "paykit.core.types",
+    "PaymentStatus": "paykit.core.types",
+    "SimulationResult": "paykit.core.types",
+    "TokenInfo": "paykit.core.types",
+    "TransactionInfo": "paykit.core.types",
+    "WalletInfo": "paykit.core.types",
+    "WalletSetInfo": "paykit.core.types",
+    # Guards
+    "BudgetGuard": "paykit.guards",
+    "ConfirmGuard": "paykit.guards",
+    "Guard": "paykit.guards",
+    "GuardChain": "paykit.guards",
+    "GuardResult": "paykit.guards",
+    "PaymentContext": "paykit.guards",
+    "RateLimitGuard": "paykit.guards",
+    "RecipientGuard": "paykit.guards",
+    "SingleTxGuard": "paykit.guards",
+    # Setup utilities
+    "ensure_setup": "paykit.onboarding",
+    "find_recovery_file": "paykit.onboarding",
+    "generate_entity_secret": "paykit.onboarding",
+    "get_config_dir": "paykit.onboarding",
+    "print_setup_status": "paykit.onboarding",
+    "quick_setup": "paykit.onboarding",
+    "verify_setup": "paykit.onboarding",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
 
-# Import guards for convenience
-from paykit.guards import (
-    BudgetGuard,
-    ConfirmGuard,
-    Guard,
-    GuardChain,
-    GuardResult,
-    PaymentContext,
-    RateLimitGuard,
-    RecipientGuard,
-    SingleTxGuard,
-)
-from paykit.onboarding import (
-    ensure_setup,
-    find_recovery_file,
-    generate_entity_secret,
-    get_config_dir,
-    print_setup_status,
-    quick_setup,
-    verify_setup,
-)
 
 __version__ = "0.0.1"
 __all__ = [
@@ -19,8 +19,11 @@ Usage:
 
 from __future__ import annotations
 
+import functools
+import importlib
 import os
-from typing import Any
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
 
 from paykit.providers.base import (
     ContractCallResult,
@@ -34,17 +37,74 @@ from paykit.providers.base import (
     WalletProvider,
     WalletSetInfo,
 )
-from paykit.providers.circle import CircleConfig, CircleProvider
-from paykit.providers.coinbase import CoinbaseConfig, CoinbaseProvider
 
+if TYPE_CHECKING:
+    from paykit.providers.circle import CircleConfig, CircleProvider
+    from paykit.providers.coinbase import CoinbaseConfig, CoinbaseProvider
 
-# Provider registry
-_PROVIDERS: dict[ProviderType, type[WalletProvider]] = {
-    ProviderType.CIRCLE: CircleProvider,
-    ProviderType.COINBASE: CoinbaseProvider,
+# Vendor modules are imported on first use so that importing this package
+# doesn't load every provider SDK.
+_LAZY_EXPORTS: dict[str, str] = {
+    "CircleProvider": "paykit.providers.circle",
+    "CircleConfig": "paykit.providers.circle",
+    "CoinbaseProvider": "paykit.providers.coinbase",
+    "CoinbaseConfig": "paykit.providers.coinbase",
 }
 
 
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+# String -> ProviderType lookup, built once at import
+_PROVIDER_BY_NAME: dict[str, ProviderType] = {p.value: p for p in ProviderType}
+
+
+def _coerce_provider_type(name: str) -> ProviderType:
+    """Resolve a provider name to its ProviderType."""
+    try:
+        return _PROVIDER_BY_NAME[name]
+    except KeyError:
+        raise ValueError(f"{name!r} is not a valid ProviderType") from None
+
+
+# Environment variables read by the factory and config builders
+_ENV_KEYS = (
+    "CIRCLE_API_KEY",
+    "ENTITY_SECRET",
+    "COINBASE_API_KEY",
+    "COINBASE_API_SECRET",
+    "PAYKIT_PROVIDER",
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _env_snapshot() -> dict[str, str]:
+    """Snapshot of the provider environment variables (read once per process)."""
+    return {key: os.environ.get(key, "") for key in _ENV_KEYS}
+
+
+@functools.lru_cache(maxsize=1)
+def _default_provider_type() -> ProviderType:
+    """Provider type from PAYKIT_PROVIDER."""
+    return _coerce_provider_type((_env_snapshot()["PAYKIT_PROVIDER"] or "circle").lower())
+
+
+def reset_env_cache() -> None:
+    """
+    Re-read provider environment variables on the next get_provider() call.
+    
+    Call this after changing PAYKIT_PROVIDER or provider credentials at runtime.
+    """
+    _env_snapshot.cache_clear()
+    _default_provider_type.cache_clear()
+
+
 def get_provider(
     provider_type: ProviderType | str | None = None,
     **kwargs: Any,
@@ -74,32 +134,36 @@ def get_provider(
     """
     # Determine provider type
     if provider_type is None:
-        env_provider = os.environ.get("PAYKIT_PROVIDER", "circle").lower()
-        provider_type = ProviderType(env_provider)
-    elif isinstance(provider_type, str):
-        provider_type = ProviderType(provider_type.lower())
+        provider_type = _default_provider_type()
+    elif not isinstance(provider_type, ProviderType):
+        provider_type = _coerce_provider_type(provider_type.lower())
     
-    # Get provider class
-    provider_class = _PROVIDERS.get(provider_type)
-    if provider_class is None:
+    # Look up provider class and its config builder
+    entry = _PROVIDERS.get(provider_type)
+    if entry is None:
         raise ValueError(f"Unknown provider type: {provider_type}")
     
-    # Build configuration
-    if provider_type == ProviderType.CIRCLE:
-        config = _build_circle_config(**kwargs)
-        return CircleProvider(config)
-    elif provider_type == ProviderType.COINBASE:
-        config = _build_coinbase_config(**kwargs)
-        return CoinbaseProvider(config)
-    else:
-        raise ValueError(f"Provider not implemented: {provider_type}")
+    provider_class, build_config = entry
+    if isinstance(provider_class, str):
+        provider_class = _import_provider_class(provider_class)
+        _PROVIDERS[provider_type] = (provider_class, build_config)
+    return provider_class(build_config(**kwargs))
+
+
+def _import_provider_class(path: str) -> type[WalletProvider]:
+    """Import a provider class from a "module:ClassName" path."""
+    module_name, _, class_name = path.partition(":")
+    return getattr(importlib.import_module(module_name), class_name)
 
 
 def _build_circle_config(**kwargs: Any) -> CircleConfig:
     """Build Circle configuration from kwargs and environment."""
+    from paykit.providers.circle import CircleConfig
+    
+    env = _env_snapshot()
     return CircleConfig(
-        api_key=kwargs.get("api_key") or os.environ.get("CIRCLE_API_KEY", ""),
-        entity_secret=kwargs.get("entity_secret") or os.environ.get("ENTITY_SECRET", ""),
+        api_key=kwargs.get("api_key") or env["CIRCLE_API_KEY"],
+        entity_secret=kwargs.get("entity_secret") or env["ENTITY_SECRET"],
         environment=kwargs.get("environment", "testnet"),
         timeout=kwargs.get("timeout", 30.0),
     )
@@ -107,17 +171,46 @@ def _build_circle_config(**kwargs: Any) -> CircleConfig:
 
 def _build_coinbase_config(**kwargs: Any) -> CoinbaseConfig:
     """Build Coinbase configuration from kwargs and environment."""
+    from paykit.providers.coinbase import CoinbaseConfig
+    
+    env = _env_snapshot()
     return CoinbaseConfig(
-        api_key=kwargs.get("api_key") or os.environ.get("COINBASE_API_KEY", ""),
-        api_secret=kwargs.get("api_secret") or os.environ.get("COINBASE_API_SECRET", ""),
+        api_key=kwargs.get("api_key") or env["COINBASE_API_KEY"],
+        api_secret=kwargs.get("api_secret") or env["COINBASE_API_SECRET"],
+        environment=kwargs.get("environment", "testnet"),
+        timeout=kwargs.get("timeout", 30.0),
+    )
+
+
+def _build_generic_config(**kwargs: Any) -> ProviderConfig:
+    """Build a base ProviderConfig for custom providers."""
+    known = {"api_key", "environment", "timeout"}
+    return ProviderConfig(
+        api_key=kwargs.get("api_key", ""),
         environment=kwargs.get("environment", "testnet"),
         timeout=kwargs.get("timeout", 30.0),
+        extra={k: v for k, v in kwargs.items() if k not in known},
     )
 
 
+ConfigBuilder = Callable[..., ProviderConfig]
+
+# Provider registry: provider type -> (provider class, config builder).
+# Built-in providers are given as "module:ClassName" paths and imported by
+# get_provider on first use.
+_PROVIDERS: dict[ProviderType, tuple[type[WalletProvider] | str, ConfigBuilder]] = {
+    ProviderType.CIRCLE: ("paykit.providers.circle:CircleProvider", _build_circle_config),
+    ProviderType.COINBASE: ("paykit.providers.coinbase:CoinbaseProvider", _build_coinbase_config),
+}
+
+# Cached result of list_providers(), reset by register_provider()
+_providers_view: tuple[ProviderType, ...] | None = None
+
+
 def register_provider(
     provider_type: ProviderType,
     provider_class: type[WalletProvider],
+    config_builder: ConfigBuilder | None = None,
 ) -> None:
     """
     Register a custom wallet provider.
@@ -127,6 +220,9 @@ def register_provider(
     Args:
         provider_type: Unique provider identifier
         provider_class: Provider class implementing WalletProvider
+        config_builder: Callable turning get_provider() kwargs into the
+            provider's config. Defaults to a base ProviderConfig with
+            unrecognised kwargs collected in ``extra``.
     
     Example:
         >>> class MyProvider(WalletProvider):
@@ -135,12 +231,18 @@ def register_provider(
         >>> 
         >>> register_provider(ProviderType("my-provider"), MyProvider)
     """
-    _PROVIDERS[provider_type] = provider_class
+    global _providers_view
+    _PROVIDERS[provider_type] = (provider_class, config_builder or _build_generic_config)
+    _providers_view = None
+    reset_env_cache()
 
 
-def list_providers() -> list[ProviderType]:
+def list_providers() -> tuple[ProviderType, ...]:
     """List all registered provider types."""
-    return list(_PROVIDERS.keys())
+    global _providers_view
+    if _providers_view is None:
+        _providers_view = tuple(_PROVIDERS)
+    return _providers_view
 
 
 __all__ = [
@@ -148,6 +250,7 @@ __all__ = [
     "get_provider",
     "register_provider",
     "list_providers",
+    "reset_env_cache",
     # Base types
     "WalletProvider",
     "CrossChainProvider",
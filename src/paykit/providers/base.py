@@ -7,11 +7,16 @@ enabling PayKit to work with Circle, Coinbase, or any other wallet infrastructur
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Iterable, Mapping
 from dataclasses import dataclass, field
 from decimal import Decimal
 from enum import Enum
-from typing import Any
+from types import MappingProxyType
+from typing import Any, TypeVar
+
+T = TypeVar("T")
 
 
 class ProviderType(str, Enum):
@@ -28,9 +33,47 @@ class TransactionState(str, Enum):
     COMPLETE = "complete"
     FAILED = "failed"
     CANCELLED = "cancelled"
+    
+    def is_terminal(self) -> bool:
+        """Whether the transaction has reached a final state."""
+        return self in _TERMINAL_STATES
+
+
+_TERMINAL_STATES = frozenset({
+    TransactionState.COMPLETE,
+    TransactionState.FAILED,
+    TransactionState.CANCELLED,
+})
+
+
+# Shared read-only default for ``raw`` so records without provider data
+# don't each allocate an empty dict. Use ensure_raw() before mutating.
+_EMPTY_RAW: Mapping[str, Any] = MappingProxyType({})
+
+
+def _empty_raw() -> Mapping[str, Any]:
+    return _EMPTY_RAW
+
+
+async def _bounded_gather(awaitables: Iterable[Awaitable[T]], concurrency: int) -> list[T]:
+    """Await ``awaitables`` with at most ``concurrency`` running, keeping input order."""
+    sem = asyncio.Semaphore(concurrency)
+    
+    async def _bounded(awaitable: Awaitable[T]) -> T:
+        async with sem:
+            return await awaitable
+    
+    return list(await asyncio.gather(*(_bounded(a) for a in awaitables)))
+
+
+def ensure_raw(record: Any) -> dict[str, Any]:
+    """Return ``record.raw`` as a mutable dict, copying the shared default if needed."""
+    if not isinstance(record.raw, dict):
+        record.raw = dict(record.raw)
+    return record.raw
 
 
-@dataclass
+@dataclass(slots=True)
 class ProviderConfig:
     """Base configuration for wallet providers."""
     api_key: str
@@ -39,7 +82,7 @@ class ProviderConfig:
     extra: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletInfo:
     """Universal wallet representation across providers."""
     id: str
@@ -49,30 +92,33 @@ class WalletInfo:
     state: str = "LIVE"
     provider: ProviderType = ProviderType.CIRCLE
     # Provider-specific data
-    raw: dict[str, Any] = field(default_factory=dict)
+    raw: Mapping[str, Any] = field(default_factory=_empty_raw)
 
 
-@dataclass
+@dataclass(slots=True)
 class WalletSetInfo:
     """Universal wallet set/group representation."""
     id: str
     name: str
     custody_type: str = "DEVELOPER"
     provider: ProviderType = ProviderType.CIRCLE
-    raw: dict[str, Any] = field(default_factory=dict)
+    raw: Mapping[str, Any] = field(default_factory=_empty_raw)
 
 
-@dataclass 
+@dataclass(slots=True)
 class TokenBalance:
     """Universal token balance representation."""
     token_id: str
-    token_symbol: str
+    token_symbol: str  # Normalized to upper case
     amount: Decimal
     blockchain: str
-    raw: dict[str, Any] = field(default_factory=dict)
+    raw: Mapping[str, Any] = field(default_factory=_empty_raw)
+    
+    def __post_init__(self) -> None:
+        self.token_symbol = self.token_symbol.upper()
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionResult:
     """Universal transaction result across providers."""
     id: str
@@ -81,16 +127,16 @@ class TransactionResult:
     amount: Decimal | None = None
     fee: Decimal | None = None
     error_message: str | None = None
-    raw: dict[str, Any] = field(default_factory=dict)
+    raw: Mapping[str, Any] = field(default_factory=_empty_raw)
 
 
-@dataclass
+@dataclass(slots=True)
 class ContractCallResult:
     """Result of a smart contract call."""
     id: str
     state: TransactionState
     tx_hash: str | None = None
-    raw: dict[str, Any] = field(default_factory=dict)
+    raw: Mapping[str, Any] = field(default_factory=_empty_raw)
 
 
 class WalletProvider(ABC):
@@ -114,8 +160,8 @@ class WalletProvider(ABC):
     
     @property
     @abstractmethod
-    def supported_blockchains(self) -> list[str]:
-        """Return list of supported blockchain identifiers."""
+    def supported_blockchains(self) -> tuple[str, ...]:
+        """Return supported blockchain identifiers as an immutable tuple."""
         pass
     
     # =========================================================================
@@ -161,6 +207,50 @@ class WalletProvider(ABC):
         """Get a wallet by ID."""
         pass
     
+    async def create_wallets(
+        self,
+        wallet_set_id: str,
+        blockchain: str,
+        count: int,
+        names: list[str | None] | None = None,
+        *,
+        concurrency: int = 16,
+    ) -> list[WalletInfo]:
+        """
+        Create several wallets in a wallet set.
+        
+        The default implementation issues concurrent ``create_wallet`` calls,
+        at most ``concurrency`` at once. Providers with a bulk creation
+        endpoint should override this.
+        
+        Args:
+            wallet_set_id: Wallet set to create the wallets in
+            blockchain: Blockchain for every wallet
+            count: Number of wallets to create
+            names: Optional name per wallet, ``count`` entries long
+        """
+        if names is not None and len(names) != count:
+            raise ValueError(f"Expected {count} names, got {len(names)}")
+        return await _bounded_gather(
+            (self.create_wallet(wallet_set_id, blockchain, name)
+             for name in (names or [None] * count)),
+            concurrency,
+        )
+    
+    async def list_wallets_many(
+        self,
+        wallet_set_ids: list[str],
+        *,
+        concurrency: int = 16,
+    ) -> list[list[WalletInfo]]:
+        """
+        List wallets for several wallet sets concurrently.
+        
+        Results are returned in the same order as ``wallet_set_ids``. At
+        most ``concurrency`` requests are in flight at once.
+        """
+        return await _bounded_gather((self.list_wallets(w) for w in wallet_set_ids), concurrency)
+    
     # =========================================================================
     # Balance Operations
     # =========================================================================
@@ -170,13 +260,44 @@ class WalletProvider(ABC):
         """Get all token balances for a wallet."""
         pass
     
+    async def get_balance_of(self, wallet_id: str, token_symbol: str = "USDC") -> Decimal:
+        """
+        Get the balance of a single token for a wallet.
+        
+        The default implementation filters ``get_balances``. Override in
+        providers that can query one token without listing them all.
+        """
+        symbol = token_symbol.upper()
+        balances = await self.get_balances(wallet_id)
+        return next((b.amount for b in balances if b.token_symbol == symbol), Decimal("0"))
+    
     async def get_usdc_balance(self, wallet_id: str) -> Decimal:
         """Get USDC balance for a wallet. Convenience method."""
-        balances = await self.get_balances(wallet_id)
-        for balance in balances:
-            if balance.token_symbol.upper() == "USDC":
-                return balance.amount
-        return Decimal("0")
+        return await self.get_balance_of(wallet_id, "USDC")
+    
+    async def get_balances_many(
+        self,
+        wallet_ids: list[str],
+        *,
+        concurrency: int = 16,
+    ) -> list[list[TokenBalance]]:
+        """
+        Get token balances for several wallets concurrently.
+        
+        Results are returned in the same order as ``wallet_ids``. At most
+        ``concurrency`` requests are in flight at once. Providers with a
+        native bulk endpoint should override this.
+        """
+        return await _bounded_gather((self.get_balances(w) for w in wallet_ids), concurrency)
+    
+    async def get_usdc_balance_many(
+        self,
+        wallet_ids: list[str],
+        *,
+        concurrency: int = 16,
+    ) -> list[Decimal]:
+        """Get USDC balances for several wallets concurrently. Convenience method."""
+        return await _bounded_gather((self.get_usdc_balance(w) for w in wallet_ids), concurrency)
     
     # =========================================================================
     # Transfer Operations
@@ -239,6 +360,14 @@ class WalletProvider(ABC):
     async def close(self) -> None:
         """Clean up provider resources. Override if needed."""
         pass
+    
+    async def __aenter__(self) -> WalletProvider:
+        """Async context manager entry."""
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Async context manager exit. Closes the provider."""
+        await self.close()
 
 
 class CrossChainProvider(ABC):
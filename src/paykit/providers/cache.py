@@ -0,0 +1,92 @@
+"""
+In-process caching for wallet provider reads.
+
+Providers use AsyncTTLCache to avoid repeated round-trips for data that
+rarely changes, such as wallet metadata.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class AsyncTTLCache(Generic[K, V]):
+    """
+    LRU cache with a per-entry time-to-live.
+
+    Concurrent misses for the same key share one load, so N callers
+    trigger a single network call. ``None`` results are not cached.
+    Cached objects are shared between callers; treat them as read-only.
+
+    Example:
+        >>> cache = AsyncTTLCache(maxsize=1024, ttl=60)
+        >>> wallet = await cache.get_or_load(wallet_id, lambda: fetch(wallet_id))
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 60.0) -> None:
+        """
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid; 0 disables caching
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self._pending: dict[K, asyncio.Future[V | None]] = {}
+
+    def get(self, key: K) -> V | None:
+        """Return a live entry, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Store a value, evicting the least recently used entry if full."""
+        if self.ttl <= 0:
+            return
+        self._entries[key] = (time.monotonic() + self.ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: K | None = None) -> None:
+        """Drop one entry, or every entry when ``key`` is None."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V | None]]) -> V | None:
+        """Return the cached value for ``key``, awaiting ``loader`` on a miss."""
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        future = self._pending.get(key)
+        if future is None:
+            future = asyncio.ensure_future(self._load(key, loader))
+            self._pending[key] = future
+        # Shield so one cancelled caller doesn't cancel the shared load
+        return await asyncio.shield(future)
+
+    async def _load(self, key: K, loader: Callable[[], Awaitable[V | None]]) -> V | None:
+        try:
+            value = await loader()
+            if value is not None:
+                self.set(key, value)
+            return value
+        finally:
+            self._pending.pop(key, None)
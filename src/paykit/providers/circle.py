@@ -7,12 +7,22 @@ Developer-Controlled Wallets API.
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import functools
+import time
 import uuid
+from collections.abc import Callable, Iterator, Mapping
 from dataclasses import dataclass, field
 from decimal import Decimal
+from enum import Enum
+from operator import attrgetter
 from typing import Any
 
-from paykit.core.cctp_constants import USDC_ADDRESSES
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding
+
+from paykit.core.cctp_constants import USDC_CONTRACTS
 from paykit.core.exceptions import ConfigurationError, NetworkError, WalletError
 from paykit.providers.base import (
     ContractCallResult,
@@ -25,16 +35,29 @@ from paykit.providers.base import (
     WalletInfo,
     WalletProvider,
     WalletSetInfo,
+    _bounded_gather,
 )
+from paykit.providers.cache import AsyncTTLCache
+from paykit.providers.retry import RETRY_STATUSES, error_status, retry_delay
 
 # Circle SDK imports
 try:
+    import urllib3
     from circle.web3 import developer_controlled_wallets, utils as circle_utils
+    from circle.web3.developer_controlled_wallets import rest as circle_rest
     CIRCLE_SDK_AVAILABLE = True
 except ImportError:
     CIRCLE_SDK_AVAILABLE = False
+    urllib3 = None
     developer_controlled_wallets = None
     circle_utils = None
+    circle_rest = None
+
+# Optional faster JSON parser (pip install paykit[fast])
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 
 @dataclass
@@ -43,6 +66,16 @@ class CircleConfig(ProviderConfig):
     entity_secret: str = ""
     # Circle-specific options
     auto_generate_entity_secret: bool = True
+    # Size of the HTTP connection pool shared by all Circle API calls;
+    # None keeps the SDK's default pool
+    max_connections: int | None = None
+    # Client-side request rate limit (requests/second); 0 disables it.
+    # Conservative default, Circle allows 35.
+    rps: float = 30.0
+    # Retries for rate-limited, gateway and connection errors
+    max_retries: int = 5
+    # Seconds get_wallet/get_wallet_set results are cached; 0 disables it
+    cache_ttl: float = 60.0
 
 
 # Mapping from our blockchain names to Circle's blockchain names
@@ -67,21 +100,206 @@ BLOCKCHAIN_MAPPING = {
 # Reverse mapping
 CIRCLE_TO_STANDARD = {v: k for k, v in BLOCKCHAIN_MAPPING.items()}
 
+SUPPORTED_BLOCKCHAINS: tuple[str, ...] = tuple(BLOCKCHAIN_MAPPING)
+
+# Chains supported by CCTP cross-chain transfers
+_CCTP_CHAINS = frozenset({
+    "ETH", "ETH-SEPOLIA",
+    "MATIC", "MATIC-AMOY",
+    "ARB", "ARB-SEPOLIA",
+    "BASE", "BASE-SEPOLIA",
+    "AVAX", "AVAX-FUJI",
+    "ARC-TESTNET",
+})
+
+# BLOCKCHAIN_MAPPING keyed by both upper- and lower-case names, so the
+# common spellings resolve without a str.upper() call
+_BC_LOOKUP = BLOCKCHAIN_MAPPING | {k.lower(): v for k, v in BLOCKCHAIN_MAPPING.items()}
+
+# RSA-OAEP padding Circle uses for entity secret ciphertexts
+_OAEP = padding.OAEP(
+    mgf=padding.MGF1(algorithm=hashes.SHA256()),
+    algorithm=hashes.SHA256(),
+    label=None,
+)
+
+# Circle's limit on wallets created by one CreateWalletRequest
+_MAX_WALLETS_PER_REQUEST = 200
+
+
+class _TokenBucket:
+    """Async token bucket allowing ``rate`` acquisitions per second."""
+    
+    def __init__(self, rate: float, capacity: float) -> None:
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self) -> None:
+        """Wait until a token is available, then take it."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self._capacity, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self._rate)
+
+
+def _install_orjson_deserializer(client: Any) -> None:
+    """
+    Parse this SDK client's response bodies with orjson instead of json.loads.
+    
+    Only the JSON decoding step changes; model construction still goes
+    through the SDK. Leaves the client untouched if orjson is missing or
+    the SDK no longer exposes its model deserializer.
+    """
+    model_deserialize = getattr(client, "_ApiClient__deserialize", None)
+    if orjson is None or model_deserialize is None:
+        return
+    sdk_deserialize = client.deserialize
+    
+    def deserialize(response: Any, response_type: Any) -> Any:
+        if response_type == "file":
+            return sdk_deserialize(response, response_type)
+        try:
+            data = orjson.loads(response.data)
+        except orjson.JSONDecodeError:
+            data = response.data
+        return model_deserialize(data, response_type)
+    
+    client.deserialize = deserialize
+
+
+class _LazyRaw(Mapping[str, Any]):
+    """Read-only ``raw`` mapping that only calls ``model.to_dict()`` when read."""
+    
+    __slots__ = ("_model", "_data")
+    
+    def __init__(self, model: Any) -> None:
+        self._model = model
+        self._data: dict[str, Any] | None = None
+    
+    def _materialize(self) -> dict[str, Any]:
+        if self._data is None:
+            self._data = self._model.to_dict()
+        return self._data
+    
+    def __getitem__(self, key: str) -> Any:
+        return self._materialize()[key]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._materialize())
+    
+    def __len__(self) -> int:
+        return len(self._materialize())
+    
+    def __repr__(self) -> str:
+        return f"_LazyRaw({type(self._model).__name__})"
+
+
+def _enum_value(value: Any) -> Any:
+    """Unwrap SDK enums to their string value, as ``to_dict()`` does."""
+    return value.value if isinstance(value, Enum) else value
+
+
+# Field extractors for Circle SDK models
+_WALLET_SET_ATTRS = attrgetter("id", "custody_type")
+_WALLET_ATTRS = attrgetter("id", "address", "blockchain", "name", "state")
+_TOKEN_ATTRS = attrgetter("id", "symbol", "blockchain")
+
+
+def _wallet_set_from_model(model: Any) -> WalletSetInfo:
+    """Build a WalletSetInfo from a Circle wallet set model."""
+    ws_id, custody_type = _WALLET_SET_ATTRS(model)
+    return WalletSetInfo(
+        id=ws_id or "",
+        name=getattr(model, "name", None) or "",
+        custody_type=_enum_value(custody_type) or "DEVELOPER",
+        provider=ProviderType.CIRCLE,
+        raw=_LazyRaw(model),
+    )
+
+
+def _wallet_from_model(model: Any) -> WalletInfo:
+    """Build a WalletInfo from a Circle wallet model."""
+    w_id, address, blockchain, name, state = _WALLET_ATTRS(model)
+    return WalletInfo(
+        id=w_id or "",
+        address=address or "",
+        blockchain=_enum_value(blockchain) or "",
+        name=name,
+        state=_enum_value(state) or "LIVE",
+        provider=ProviderType.CIRCLE,
+        raw=_LazyRaw(model),
+    )
+
+
+_ZERO = Decimal("0")
+
+
+def _parse_amount(amount: str | None) -> Decimal:
+    """Parse a Circle amount string, sharing one Decimal for zero balances."""
+    if not amount or amount == "0":
+        return _ZERO
+    return Decimal(amount)
+
+
+def _balance_from_model(model: Any) -> TokenBalance:
+    """Build a TokenBalance from a Circle token balance model."""
+    token_id, symbol, blockchain = _TOKEN_ATTRS(model.token)
+    return TokenBalance(
+        token_id=token_id or "",
+        token_symbol=symbol or "",
+        amount=_parse_amount(model.amount),
+        blockchain=_enum_value(blockchain) or "",
+        raw=_LazyRaw(model),
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _abi_signature(function_name: str, param_types: tuple[str, ...]) -> str:
+    """Function signature such as ``approve(address,uint256)``, keyed by content."""
+    return f"{function_name}({','.join(param_types)})"
+
+
+# Circle transaction states mapped to our universal states
+_STATE_MAP = {
+    "INITIATED": TransactionState.PENDING,
+    "PENDING_RISK_SCREENING": TransactionState.PENDING,
+    "QUEUED": TransactionState.PENDING,
+    "SENT": TransactionState.PENDING,
+    "CONFIRMED": TransactionState.CONFIRMED,
+    "COMPLETE": TransactionState.COMPLETE,
+    "FAILED": TransactionState.FAILED,
+    "CANCELLED": TransactionState.CANCELLED,
+    "DENIED": TransactionState.FAILED,
+}
+_STATE_MAP.update({k.lower(): v for k, v in list(_STATE_MAP.items())})
+
+
+def _new_idempotency_key() -> str:
+    """
+    Generate an idempotency key for a Circle write request.
+    
+    Circle documents the key as a UUID v4 and the SDK's own auto-fill uses
+    the canonical hyphenated form, so that format is kept rather than hex.
+    """
+    return str(uuid.uuid4())
+
 
 def _map_transaction_state(circle_state: str) -> TransactionState:
     """Map Circle transaction states to our universal states."""
-    state_map = {
-        "INITIATED": TransactionState.PENDING,
-        "PENDING_RISK_SCREENING": TransactionState.PENDING,
-        "QUEUED": TransactionState.PENDING,
-        "SENT": TransactionState.PENDING,
-        "CONFIRMED": TransactionState.CONFIRMED,
-        "COMPLETE": TransactionState.COMPLETE,
-        "FAILED": TransactionState.FAILED,
-        "CANCELLED": TransactionState.CANCELLED,
-        "DENIED": TransactionState.FAILED,
-    }
-    return state_map.get(circle_state.upper(), TransactionState.PENDING)
+    state = _STATE_MAP.get(circle_state)
+    if state is None:
+        return _STATE_MAP.get(circle_state.upper(), TransactionState.PENDING)
+    return state
 
 
 class CircleProvider(WalletProvider, CrossChainProvider):
@@ -91,6 +309,11 @@ class CircleProvider(WalletProvider, CrossChainProvider):
     This provider uses Circle's Web3 Services API to manage wallets
     and execute transactions.
     
+    All API calls share one pooled HTTP client, so create a single
+    provider per process and reuse it rather than one per request.
+    The Circle SDK is synchronous; its calls run in worker threads so
+    concurrent callers don't block the event loop.
+    
     Example:
         >>> config = CircleConfig(api_key="...", entity_secret="...")
         >>> provider = CircleProvider(config)
@@ -105,6 +328,19 @@ class CircleProvider(WalletProvider, CrossChainProvider):
         
         self._config = config
         
+        # Parsed on first _get_ciphertext() call
+        self._entity_public_key: Any = None
+        self._entity_secret_bytes = b""
+        
+        # USDC token ID per wallet; Circle token IDs are stable per wallet
+        self._usdc_token_ids: dict[str, str] = {}
+        
+        # Wallet and wallet set metadata rarely changes after creation
+        self._wallet_cache: AsyncTTLCache[str, WalletInfo] = AsyncTTLCache(ttl=config.cache_ttl)
+        self._wallet_set_cache: AsyncTTLCache[str, WalletSetInfo] = AsyncTTLCache(
+            ttl=config.cache_ttl
+        )
+        
         try:
             self._client = circle_utils.init_developer_controlled_wallets_client(
                 api_key=config.api_key,
@@ -116,7 +352,20 @@ class CircleProvider(WalletProvider, CrossChainProvider):
                 details={"error": str(e)},
             ) from e
         
-        # Initialize API instances
+        # Rebuild the REST client only when the pool is explicitly sized
+        # (the SDK default is tied to the CPU count)
+        if config.max_connections is not None:
+            self._client.configuration.connection_pool_maxsize = config.max_connections
+            self._client.rest_client = circle_rest.RESTClientObject(self._client.configuration)
+        _install_orjson_deserializer(self._client)
+        
+        self._limiter = (
+            _TokenBucket(rate=config.rps, capacity=config.rps * 2) if config.rps > 0 else None
+        )
+        # Bounds concurrent writes so transfer fan-outs can't exhaust the pool
+        self._write_sem = asyncio.Semaphore(self._client.configuration.connection_pool_maxsize)
+        
+        # Initialize API instances; they all share self._client's pool
         self._wallet_sets_api = developer_controlled_wallets.WalletSetsApi(self._client)
         self._wallets_api = developer_controlled_wallets.WalletsApi(self._client)
         self._transactions_api = developer_controlled_wallets.TransactionsApi(self._client)
@@ -126,19 +375,97 @@ class CircleProvider(WalletProvider, CrossChainProvider):
         return ProviderType.CIRCLE
     
     @property
-    def supported_blockchains(self) -> list[str]:
-        return list(BLOCKCHAIN_MAPPING.keys())
+    def supported_blockchains(self) -> tuple[str, ...]:
+        return SUPPORTED_BLOCKCHAINS
     
     def _get_ciphertext(self) -> str:
-        """Generate entity secret ciphertext for signing."""
-        return circle_utils.generate_entity_secret_ciphertext(
-            api_key=self._config.api_key,
-            entity_secret_hex=self._config.entity_secret,
-        )
+        """
+        Generate entity secret ciphertext for signing.
+        
+        Circle rejects reused ciphertexts, so each call encrypts afresh.
+        Only the parsed public key and decoded secret are cached.
+        """
+        if self._entity_public_key is None:
+            secret = bytes.fromhex(self._config.entity_secret)
+            if len(secret) != 32:
+                raise ConfigurationError("Entity secret must be 32 bytes (64 hex characters)")
+            # Reads the key from the client configuration; no HTTP request
+            pem = self._client.configuration.get_public_key()
+            self._entity_public_key = serialization.load_pem_public_key(pem.encode())
+            self._entity_secret_bytes = secret
+        
+        encrypted = self._entity_public_key.encrypt(self._entity_secret_bytes, _OAEP)
+        return base64.b64encode(encrypted).decode()
+    
+    async def _call(self, method: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """Call a synchronous SDK method in a worker thread, with retries."""
+        return await self._send(lambda: method(*args, **kwargs))
+    
+    async def _send(self, call: Callable[[], Any]) -> Any:
+        """
+        Run ``call`` in a worker thread, retrying transient failures.
+        
+        Calls are paced by the provider's rate limiter. Rate-limited and
+        gateway errors (429/502/503/504) and connection failures are retried
+        after Circle's Retry-After delay, or exponential backoff with jitter,
+        up to ``max_retries`` times. Retried writes are rebuilt by _write()
+        with a fresh entity secret ciphertext (Circle rejects reused ones)
+        and keep their idempotency key, so Circle applies them at most once.
+        
+        Raises:
+            NetworkError: If the Circle API can't be reached
+        """
+        attempt = 0
+        while True:
+            if self._limiter is not None:
+                await self._limiter.acquire()
+            try:
+                return await asyncio.to_thread(call)
+            except developer_controlled_wallets.ApiException as e:
+                if (
+                    error_status(e) not in RETRY_STATUSES
+                    or attempt >= self._config.max_retries
+                ):
+                    raise
+                await asyncio.sleep(retry_delay(e, attempt))
+            except urllib3.exceptions.HTTPError as e:
+                if attempt >= self._config.max_retries:
+                    raise NetworkError(
+                        f"Circle API request failed: {e}",
+                        details={"error": str(e)},
+                    ) from e
+                await asyncio.sleep(retry_delay(e, attempt))
+            attempt += 1
+    
+    async def _write(
+        self,
+        method: Callable[..., Any],
+        request_cls: Any,
+        fields: dict[str, Any],
+    ) -> Any:
+        """
+        Send a write request, bounded by the write semaphore.
+        
+        The request is built from ``fields`` on every attempt with a fresh
+        entity secret ciphertext, since Circle rejects reused ciphertexts.
+        ``fields`` must carry the idempotency key, which stays the same
+        across attempts.
+        """
+        def build_and_send() -> Any:
+            request = request_cls.from_dict(
+                {**fields, "entitySecretCiphertext": self._get_ciphertext()}
+            )
+            return method(request)
+        
+        async with self._write_sem:
+            return await self._send(build_and_send)
     
     def _to_circle_blockchain(self, blockchain: str) -> str:
         """Convert standard blockchain name to Circle format."""
-        return BLOCKCHAIN_MAPPING.get(blockchain.upper(), blockchain)
+        circle_blockchain = _BC_LOOKUP.get(blockchain)
+        if circle_blockchain is None:
+            return BLOCKCHAIN_MAPPING.get(blockchain.upper(), blockchain)
+        return circle_blockchain
     
     # =========================================================================
     # Wallet Set Operations
@@ -146,59 +473,39 @@ class CircleProvider(WalletProvider, CrossChainProvider):
     
     async def list_wallet_sets(self) -> list[WalletSetInfo]:
         try:
-            response = self._wallet_sets_api.get_wallet_sets()
-            result = []
-            
-            for ws in response.data.wallet_sets:
-                ws_data = ws.to_dict()
-                result.append(WalletSetInfo(
-                    id=ws_data.get("id", ""),
-                    name=ws_data.get("name", ""),
-                    custody_type=ws_data.get("custodyType", "DEVELOPER"),
-                    provider=ProviderType.CIRCLE,
-                    raw=ws_data,
-                ))
-            
-            return result
+            response = await self._call(self._wallet_sets_api.get_wallet_sets)
+            return [
+                _wallet_set_from_model(ws.actual_instance)
+                for ws in response.data.wallet_sets
+            ]
             
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(f"Failed to list wallet sets: {e}")
     
     async def create_wallet_set(self, name: str) -> WalletSetInfo:
         try:
-            ciphertext = self._get_ciphertext()
-            idempotency_key = str(uuid.uuid4())
-            
-            request = developer_controlled_wallets.CreateWalletSetRequest.from_dict({
-                "name": name,
-                "idempotencyKey": idempotency_key,
-                "entitySecretCiphertext": ciphertext,
-            })
-            response = self._wallet_sets_api.create_wallet_set(request)
-            
-            ws_data = response.data.wallet_set.to_dict()
-            return WalletSetInfo(
-                id=ws_data.get("id", ""),
-                name=ws_data.get("name", ""),
-                custody_type=ws_data.get("custodyType", "DEVELOPER"),
-                provider=ProviderType.CIRCLE,
-                raw=ws_data,
+            response = await self._write(
+                self._wallet_sets_api.create_wallet_set,
+                developer_controlled_wallets.CreateWalletSetRequest,
+                {"name": name, "idempotencyKey": _new_idempotency_key()},
             )
             
+            wallet_set = _wallet_set_from_model(response.data.wallet_set.actual_instance)
+            self._wallet_set_cache.set(wallet_set.id, wallet_set)
+            return wallet_set
+            
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(f"Failed to create wallet set: {e}")
     
     async def get_wallet_set(self, wallet_set_id: str) -> WalletSetInfo | None:
+        return await self._wallet_set_cache.get_or_load(
+            wallet_set_id, lambda: self._fetch_wallet_set(wallet_set_id)
+        )
+    
+    async def _fetch_wallet_set(self, wallet_set_id: str) -> WalletSetInfo | None:
         try:
-            response = self._wallet_sets_api.get_wallet_set(wallet_set_id)
-            ws_data = response.data.wallet_set.actual_instance.to_dict()
-            return WalletSetInfo(
-                id=ws_data.get("id", ""),
-                name=ws_data.get("name", ""),
-                custody_type=ws_data.get("custodyType", "DEVELOPER"),
-                provider=ProviderType.CIRCLE,
-                raw=ws_data,
-            )
+            response = await self._call(self._wallet_sets_api.get_wallet_set, wallet_set_id)
+            return _wallet_set_from_model(response.data.wallet_set.actual_instance)
         except developer_controlled_wallets.ApiException:
             return None
     
@@ -212,22 +519,11 @@ class CircleProvider(WalletProvider, CrossChainProvider):
             if wallet_set_id:
                 kwargs["wallet_set_id"] = wallet_set_id
             
-            response = self._wallets_api.get_wallets(**kwargs)
-            result = []
-            
-            for wallet in response.data.wallets:
-                w_data = wallet.actual_instance.to_dict()
-                result.append(WalletInfo(
-                    id=w_data.get("id", ""),
-                    address=w_data.get("address", ""),
-                    blockchain=w_data.get("blockchain", ""),
-                    name=w_data.get("name"),
-                    state=w_data.get("state", "LIVE"),
-                    provider=ProviderType.CIRCLE,
-                    raw=w_data,
-                ))
-            
-            return result
+            response = await self._call(self._wallets_api.get_wallets, **kwargs)
+            return [
+                _wallet_from_model(wallet.actual_instance)
+                for wallet in response.data.wallets
+            ]
             
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(f"Failed to list wallets: {e}")
@@ -238,50 +534,71 @@ class CircleProvider(WalletProvider, CrossChainProvider):
         blockchain: str,
         name: str | None = None,
     ) -> WalletInfo:
-        try:
-            ciphertext = self._get_ciphertext()
-            idempotency_key = str(uuid.uuid4())
-            circle_blockchain = self._to_circle_blockchain(blockchain)
-            
-            request = developer_controlled_wallets.CreateWalletRequest.from_dict({
+        wallets = await self.create_wallets(wallet_set_id, blockchain, 1, [name])
+        return wallets[0]
+    
+    async def create_wallets(
+        self,
+        wallet_set_id: str,
+        blockchain: str,
+        count: int,
+        names: list[str | None] | None = None,
+        *,
+        concurrency: int = 16,
+    ) -> list[WalletInfo]:
+        """
+        Create several wallets using Circle's ``count`` parameter.
+        
+        Up to 200 wallets are created per request, so one ciphertext and
+        one round-trip cover each batch. Names are sent to Circle as wallet
+        metadata. At most ``concurrency`` batch requests run at once.
+        """
+        if names is not None and len(names) != count:
+            raise ValueError(f"Expected {count} names, got {len(names)}")
+        circle_blockchain = self._to_circle_blockchain(blockchain)
+        
+        async def _create_batch(start: int) -> list[WalletInfo]:
+            fields: dict[str, Any] = {
                 "walletSetId": wallet_set_id,
                 "blockchains": [circle_blockchain],
-                "count": 1,
+                "count": min(_MAX_WALLETS_PER_REQUEST, count - start),
                 "accountType": "EOA",
-                "idempotencyKey": idempotency_key,
-                "entitySecretCiphertext": ciphertext,
-            })
-            response = self._wallets_api.create_wallet(request)
-            
-            wallet = response.data.wallets[0]
-            w_data = wallet.actual_instance.to_dict()
-            
-            return WalletInfo(
-                id=w_data.get("id", ""),
-                address=w_data.get("address", ""),
-                blockchain=w_data.get("blockchain", ""),
-                name=name,
-                state=w_data.get("state", "LIVE"),
-                provider=ProviderType.CIRCLE,
-                raw=w_data,
+                "idempotencyKey": _new_idempotency_key(),
+            }
+            if names is not None:
+                fields["metadata"] = [
+                    {"name": name} if name is not None else {}
+                    for name in names[start:start + _MAX_WALLETS_PER_REQUEST]
+                ]
+            response = await self._write(
+                self._wallets_api.create_wallet,
+                developer_controlled_wallets.CreateWalletRequest,
+                fields,
+            )
+            return [_wallet_from_model(wallet.actual_instance) for wallet in response.data.wallets]
+        
+        try:
+            batches = await _bounded_gather(
+                (_create_batch(start) for start in range(0, count, _MAX_WALLETS_PER_REQUEST)),
+                concurrency,
             )
-            
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(f"Failed to create wallet: {e}")
+        
+        result = [wallet for batch in batches for wallet in batch]
+        for wallet in result:
+            self._wallet_cache.set(wallet.id, wallet)
+        return result
     
     async def get_wallet(self, wallet_id: str) -> WalletInfo | None:
+        return await self._wallet_cache.get_or_load(
+            wallet_id, lambda: self._fetch_wallet(wallet_id)
+        )
+    
+    async def _fetch_wallet(self, wallet_id: str) -> WalletInfo | None:
         try:
-            response = self._wallets_api.get_wallet(wallet_id)
-            w_data = response.data.wallet.actual_instance.to_dict()
-            return WalletInfo(
-                id=w_data.get("id", ""),
-                address=w_data.get("address", ""),
-                blockchain=w_data.get("blockchain", ""),
-                name=w_data.get("name"),
-                state=w_data.get("state", "LIVE"),
-                provider=ProviderType.CIRCLE,
-                raw=w_data,
-            )
+            response = await self._call(self._wallets_api.get_wallet, wallet_id)
+            return _wallet_from_model(response.data.wallet.actual_instance)
         except developer_controlled_wallets.ApiException:
             return None
     
@@ -291,21 +608,26 @@ class CircleProvider(WalletProvider, CrossChainProvider):
     
     async def get_balances(self, wallet_id: str) -> list[TokenBalance]:
         try:
-            response = self._wallets_api.list_wallet_balance(wallet_id)
-            result = []
+            response = await self._call(self._wallets_api.list_wallet_balance, wallet_id)
+            return [_balance_from_model(tb) for tb in response.data.token_balances]
             
+        except developer_controlled_wallets.ApiException as e:
+            raise WalletError(f"Failed to get balances: {e}")
+    
+    async def get_balance_of(self, wallet_id: str, token_symbol: str = "USDC") -> Decimal:
+        """
+        Get the balance of a single token.
+        
+        Reads the SDK models directly and only parses the matching row,
+        instead of building a TokenBalance for every token in the wallet.
+        """
+        symbol = token_symbol.upper()
+        try:
+            response = await self._call(self._wallets_api.list_wallet_balance, wallet_id)
             for tb in response.data.token_balances:
-                b_data = tb.to_dict()
-                token_data = b_data.get("token", {})
-                result.append(TokenBalance(
-                    token_id=token_data.get("id", ""),
-                    token_symbol=token_data.get("symbol", ""),
-                    amount=Decimal(b_data.get("amount", "0")),
-                    blockchain=token_data.get("blockchain", ""),
-                    raw=b_data,
-                ))
-            
-            return result
+                if (tb.token.symbol or "").upper() == symbol:
+                    return _parse_amount(tb.amount)
+            return _ZERO
             
         except developer_controlled_wallets.ApiException as e:
             raise WalletError(f"Failed to get balances: {e}")
@@ -314,6 +636,35 @@ class CircleProvider(WalletProvider, CrossChainProvider):
     # Transfer Operations
     # =========================================================================
     
+    async def _get_usdc_token_id(self, wallet_id: str) -> str:
+        """Get the USDC token ID for a wallet, querying balances on first use."""
+        token_id = self._usdc_token_ids.get(wallet_id)
+        if token_id:
+            return token_id
+        
+        balances = await self.get_balances(wallet_id)
+        # Symbols are already upper-cased; reversed so the first match wins
+        by_symbol = {b.token_symbol: b.token_id for b in reversed(balances)}
+        token_id = by_symbol.get("USDC") or by_symbol.get("USDC-TESTNET")
+        
+        if not token_id:
+            raise WalletError("USDC token not found in wallet")
+        
+        self._usdc_token_ids[wallet_id] = token_id
+        return token_id
+    
+    def invalidate_token_cache(self, wallet_id: str | None = None) -> None:
+        """
+        Forget cached USDC token IDs.
+        
+        Args:
+            wallet_id: Wallet to forget, or None to clear every wallet
+        """
+        if wallet_id is None:
+            self._usdc_token_ids.clear()
+        else:
+            self._usdc_token_ids.pop(wallet_id, None)
+    
     async def transfer(
         self,
         wallet_id: str,
@@ -323,31 +674,23 @@ class CircleProvider(WalletProvider, CrossChainProvider):
         idempotency_key: str | None = None,
     ) -> TransactionResult:
         try:
-            # Find USDC token ID for this wallet
-            balances = await self.get_balances(wallet_id)
-            token_id = None
-            for balance in balances:
-                if balance.token_symbol.upper() in ("USDC", "USDC-TESTNET"):
-                    token_id = balance.token_id
-                    break
-            
-            if not token_id:
-                raise WalletError("USDC token not found in wallet")
+            token_id = await self._get_usdc_token_id(wallet_id)
             
-            ciphertext = self._get_ciphertext()
             if not idempotency_key:
-                idempotency_key = str(uuid.uuid4())
+                idempotency_key = _new_idempotency_key()
             
-            request = developer_controlled_wallets.CreateTransferTransactionForDeveloperRequest.from_dict({
-                "idempotencyKey": idempotency_key,
-                "entitySecretCiphertext": ciphertext,
-                "walletId": wallet_id,
-                "tokenId": token_id,
-                "destinationAddress": recipient,
-                "amounts": [str(amount)],
-                "feeLevel": "MEDIUM",
-            })
-            response = self._transactions_api.create_developer_transaction_transfer(request)
+            response = await self._write(
+                self._transactions_api.create_developer_transaction_transfer,
+                developer_controlled_wallets.CreateTransferTransactionForDeveloperRequest,
+                {
+                    "idempotencyKey": idempotency_key,
+                    "walletId": wallet_id,
+                    "tokenId": token_id,
+                    "destinationAddress": recipient,
+                    "amounts": [str(amount)],
+                    "feeLevel": "MEDIUM",
+                },
+            )
             
             tx_data = response.data.to_dict()
             return TransactionResult(
@@ -363,7 +706,7 @@ class CircleProvider(WalletProvider, CrossChainProvider):
     
     async def get_transaction(self, transaction_id: str) -> TransactionResult | None:
         try:
-            response = self._transactions_api.get_transaction(transaction_id)
+            response = await self._call(self._transactions_api.get_transaction, transaction_id)
             tx_data = response.data.transaction.to_dict()
             return TransactionResult(
                 id=tx_data.get("id", ""),
@@ -388,22 +731,21 @@ class CircleProvider(WalletProvider, CrossChainProvider):
         value: str = "0",
     ) -> ContractCallResult:
         try:
-            ciphertext = self._get_ciphertext()
-            idempotency_key = str(uuid.uuid4())
-            
             # Build ABI function signature from the ABI
             abi_signature = self._build_abi_signature(abi, function_name)
             
-            request = developer_controlled_wallets.CreateContractExecutionTransactionForDeveloperRequest.from_dict({
-                "idempotencyKey": idempotency_key,
-                "entitySecretCiphertext": ciphertext,
-                "walletId": wallet_id,
-                "contractAddress": contract_address,
-                "abiFunctionSignature": abi_signature,
-                "abiParameters": [str(p) for p in params],
-                "feeLevel": "MEDIUM",
-            })
-            response = self._transactions_api.create_developer_transaction_contract_execution(request)
+            response = await self._write(
+                self._transactions_api.create_developer_transaction_contract_execution,
+                developer_controlled_wallets.CreateContractExecutionTransactionForDeveloperRequest,
+                {
+                    "idempotencyKey": _new_idempotency_key(),
+                    "walletId": wallet_id,
+                    "contractAddress": contract_address,
+                    "abiFunctionSignature": abi_signature,
+                    "abiParameters": [str(p) for p in params],
+                    "feeLevel": "MEDIUM",
+                },
+            )
             
             tx_data = response.data.to_dict()
             return ContractCallResult(
@@ -421,8 +763,7 @@ class CircleProvider(WalletProvider, CrossChainProvider):
         for item in abi:
             if item.get("type") == "function" and item.get("name") == function_name:
                 inputs = item.get("inputs", [])
-                param_types = ",".join(inp.get("type", "") for inp in inputs)
-                return f"{function_name}({param_types})"
+                return _abi_signature(function_name, tuple(inp.get("type", "") for inp in inputs))
         return function_name
     
     # =========================================================================
@@ -452,15 +793,10 @@ class CircleProvider(WalletProvider, CrossChainProvider):
     
     def supports_cross_chain(self, source: str, destination: str) -> bool:
         """Check if CCTP supports this chain pair."""
-        cctp_chains = {
-            "ETH", "ETH-SEPOLIA",
-            "MATIC", "MATIC-AMOY",
-            "ARB", "ARB-SEPOLIA",
-            "BASE", "BASE-SEPOLIA",
-            "AVAX", "AVAX-FUJI",
-            "ARC-TESTNET",
-        }
-        return source.upper() in cctp_chains and destination.upper() in cctp_chains
+        return (
+            (source in _CCTP_CHAINS or source.upper() in _CCTP_CHAINS)
+            and (destination in _CCTP_CHAINS or destination.upper() in _CCTP_CHAINS)
+        )
     
     # =========================================================================
     # Provider-Specific Methods
@@ -473,4 +809,13 @@ class CircleProvider(WalletProvider, CrossChainProvider):
     
     def get_usdc_contract_address(self, blockchain: str) -> str | None:
         """Get USDC contract address for a blockchain."""
-        return USDC_ADDRESSES.get(blockchain.upper())
+        return USDC_CONTRACTS.get(blockchain.upper())
+    
+    # =========================================================================
+    # Cleanup
+    # =========================================================================
+    
+    async def close(self) -> None:
+        """Close pooled HTTP connections to the Circle API."""
+        self._client.rest_client.pool_manager.clear()
+        self._client.close()
@@ -9,12 +9,18 @@ Requires: pip install cdp-sdk
 
 from __future__ import annotations
 
+import asyncio
 import os
+import secrets
+import time
+from collections.abc import Awaitable, Callable, Mapping
 from dataclasses import dataclass, field
-from decimal import Decimal
-from typing import Any
+from decimal import ROUND_DOWN, Decimal
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, TypeVar
 
-from paykit.core.exceptions import ConfigurationError, WalletError
+from paykit.core.exceptions import ConfigurationError, NetworkError, WalletError
+from paykit.core.logging import get_logger
 from paykit.providers.base import (
     ContractCallResult,
     ProviderConfig,
@@ -26,14 +32,29 @@ from paykit.providers.base import (
     WalletProvider,
     WalletSetInfo,
 )
+from paykit.providers.cache import AsyncTTLCache
+from paykit.providers.retry import RETRY_STATUSES, error_status, retry_delay
+
+if TYPE_CHECKING:
+    from paykit.storage.base import StorageBackend
 
 # Coinbase CDP SDK imports
 try:
     from cdp import CdpClient
+    from cdp.evm_transaction_types import TransactionRequestEIP1559
     CDP_SDK_AVAILABLE = True
 except ImportError:
     CDP_SDK_AVAILABLE = False
     CdpClient = None
+    TransactionRequestEIP1559 = None
+
+# ABI encoding for contract calls (installed with cdp-sdk)
+try:
+    from eth_abi import encode as abi_encode
+    from eth_utils import keccak
+except ImportError:
+    abi_encode = None
+    keccak = None
 
 
 @dataclass
@@ -41,12 +62,24 @@ class CoinbaseConfig(ProviderConfig):
     """Coinbase-specific configuration."""
     api_secret: str = ""
     wallet_secret: str = ""
+    # Seconds CDP account objects are cached per wallet; 0 disables it
+    account_cache_ttl: float = 300.0
+    # Seconds balances are cached per wallet and network; 0 disables it
+    balance_ttl: float = 2.0
+    # Seconds a listing of CDP accounts is reused by list_wallets; 0 disables it
+    list_ttl: float = 30.0
+    # Retries for transient CDP errors (rate limits, gateway errors)
+    max_retries: int = 3
+    # Consecutive transient failures that open the circuit breaker, and
+    # seconds it stays open before letting a trial call through
+    breaker_threshold: int = 5
+    breaker_cooldown: float = 30.0
     # Environment variables used by CDP SDK
     # CDP_API_KEY_ID, CDP_API_KEY_SECRET, CDP_WALLET_SECRET
 
 
-# Blockchain mapping: PayKit names -> Coinbase network names
-BLOCKCHAIN_MAPPING = {
+# Blockchain mapping: PayKit names -> Coinbase network names (read-only)
+BLOCKCHAIN_MAPPING: Mapping[str, str] = MappingProxyType({
     # Testnets
     "ETH-SEPOLIA": "ethereum-sepolia",
     "BASE-SEPOLIA": "base-sepolia",
@@ -59,16 +92,172 @@ BLOCKCHAIN_MAPPING = {
     "SOL": "solana",
     "MATIC": "polygon",
     "AVAX": "avalanche",
-}
+})
+
+# Reverse mapping (read-only)
+COINBASE_TO_STANDARD: Mapping[str, str] = MappingProxyType(
+    {v: k for k, v in BLOCKCHAIN_MAPPING.items()}
+)
+
+SUPPORTED_BLOCKCHAINS: tuple[str, ...] = tuple(BLOCKCHAIN_MAPPING)
 
-# Reverse mapping
-COINBASE_TO_STANDARD = {v: k for k, v in BLOCKCHAIN_MAPPING.items()}
+# Both mappings keyed by upper- and lower-case names, so the common
+# spellings resolve without a case-conversion call. Kept as plain dicts:
+# lookups through a MappingProxyType cost an extra indirection.
+_NET_LOOKUP = dict(BLOCKCHAIN_MAPPING) | {k.lower(): v for k, v in BLOCKCHAIN_MAPPING.items()}
+_STD_LOOKUP = dict(COINBASE_TO_STANDARD) | {k.upper(): v for k, v in COINBASE_TO_STANDARD.items()}
+
+# Multipliers from token amounts to atomic units
+_SOL_SCALE = 10**9
+_ETH_SCALE = 10**18
+_SCALES = {"USDC": 10**6, "SOL": _SOL_SCALE, "ETH": _ETH_SCALE}
+
+
+def _to_atomic(amount: Decimal, scale: int) -> int:
+    """Convert a token amount to atomic units, truncating sub-unit dust."""
+    if amount.as_tuple().exponent >= 0:
+        # Whole amounts scale with plain integer arithmetic
+        return int(amount) * scale
+    return int((amount * scale).to_integral_value(rounding=ROUND_DOWN))
+
+
+# Solana chain names (PayKit and Coinbase spellings), upper-cased
+_SOL_CHAINS = frozenset({"SOL", "SOL-DEVNET", "SOLANA", "SOLANA-DEVNET"})
 
 
 def _map_blockchain_type(blockchain: str) -> str:
     """Determine if blockchain is EVM or Solana."""
-    sol_chains = {"SOL", "SOL-DEVNET", "solana", "solana-devnet"}
-    return "solana" if blockchain.upper() in sol_chains or blockchain.lower() in sol_chains else "evm"
+    return "solana" if blockchain.upper() in _SOL_CHAINS else "evm"
+
+
+T = TypeVar("T")
+
+# Reads are retried on any of RETRY_STATUSES. Writes carry no idempotency
+# key, so they are only retried on 429, which CDP returns before doing
+# any work.
+_WRITE_RETRY_STATUSES = frozenset({429})
+
+
+def _is_rejection(error: BaseException) -> bool:
+    """
+    Whether CDP rejected a request for this name, e.g. not found or invalid.
+    
+    Auth, rate-limit, server and transport errors are not rejections; they
+    would fail the same way on the other chain.
+    """
+    status = error_status(error)
+    return status is not None and 400 <= status < 500 and status not in (401, 403, 429)
+
+
+class _CircuitBreaker:
+    """
+    Fail fast after repeated transient failures.
+    
+    Opens after ``threshold`` consecutive failures. Once ``cooldown``
+    seconds have passed, calls are let through again; one success closes
+    the breaker and one failure re-opens it.
+    """
+    
+    __slots__ = ("threshold", "cooldown", "_failures", "_opened_at")
+    
+    def __init__(self, threshold: int, cooldown: float) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._opened_at: float | None = None
+    
+    def allow(self) -> bool:
+        if self._opened_at is None:
+            return True
+        return time.monotonic() - self._opened_at >= self.cooldown
+    
+    def record_success(self) -> None:
+        self._failures = 0
+        self._opened_at = None
+    
+    def record_failure(self) -> None:
+        self._failures += 1
+        if self._failures >= self.threshold:
+            self._opened_at = time.monotonic()
+
+
+def _token_amount(amount: Any) -> Decimal:
+    """
+    Convert a CDP balance amount to a Decimal token amount.
+    
+    CDP reports amounts as atomic integers with their decimals, which are
+    scaled exactly. Plain numbers are converted directly, going through
+    str() only for floats.
+    """
+    atomic = getattr(amount, "amount", None)
+    if atomic is not None:
+        return Decimal(atomic).scaleb(-amount.decimals)
+    if isinstance(amount, Decimal):
+        return amount
+    if isinstance(amount, int):
+        return Decimal(amount)
+    return Decimal(str(amount))
+
+
+def _abi_type(param: dict[str, Any]) -> str:
+    """Canonical ABI type of a function input, expanding tuple components."""
+    abi_type = param.get("type", "")
+    if abi_type.startswith("tuple"):
+        components = ",".join(_abi_type(c) for c in param.get("components", []))
+        return f"({components}){abi_type[len('tuple'):]}"
+    return abi_type
+
+
+logger = get_logger("providers.coinbase")
+
+# Page size for CDP list_accounts calls
+_LIST_PAGE_SIZE = 100
+
+# Storage collections for the persisted account / wallet set registries
+_ACCOUNTS_COLLECTION = "coinbase_accounts"
+_WALLET_SETS_COLLECTION = "coinbase_wallet_sets"
+
+
+def _wallet_to_record(wallet: WalletInfo) -> dict[str, Any]:
+    return {
+        "id": wallet.id,
+        "address": wallet.address,
+        "blockchain": wallet.blockchain,
+        "name": wallet.name,
+        "state": wallet.state,
+        "raw": dict(wallet.raw),
+    }
+
+
+def _wallet_from_record(data: dict[str, Any]) -> WalletInfo:
+    return WalletInfo(
+        id=data["id"],
+        address=data["address"],
+        blockchain=data["blockchain"],
+        name=data.get("name"),
+        state=data.get("state", "LIVE"),
+        provider=ProviderType.COINBASE,
+        raw=data.get("raw") or {},
+    )
+
+
+def _wallet_set_to_record(wallet_set: WalletSetInfo) -> dict[str, Any]:
+    return {
+        "id": wallet_set.id,
+        "name": wallet_set.name,
+        "custody_type": wallet_set.custody_type,
+        "raw": dict(wallet_set.raw),
+    }
+
+
+def _wallet_set_from_record(data: dict[str, Any]) -> WalletSetInfo:
+    return WalletSetInfo(
+        id=data["id"],
+        name=data["name"],
+        custody_type=data.get("custody_type", "DEVELOPER"),
+        provider=ProviderType.COINBASE,
+        raw=data.get("raw") or {},
+    )
 
 
 class CoinbaseProvider(WalletProvider):
@@ -94,9 +283,17 @@ class CoinbaseProvider(WalletProvider):
         CDP_API_KEY_ID: Coinbase API Key ID
         CDP_API_KEY_SECRET: Coinbase API Key Secret
         CDP_WALLET_SECRET: Coinbase Wallet Secret for signing
+    
+    Pass a ``storage`` backend to persist the account and wallet set
+    registries, so known wallets resolve without CDP lookups after a
+    restart.
     """
     
-    def __init__(self, config: CoinbaseConfig) -> None:
+    def __init__(
+        self,
+        config: CoinbaseConfig,
+        storage: StorageBackend | None = None,
+    ) -> None:
         if not CDP_SDK_AVAILABLE:
             raise ConfigurationError(
                 "Coinbase CDP SDK not installed. Run: pip install cdp-sdk"
@@ -104,47 +301,199 @@ class CoinbaseProvider(WalletProvider):
         
         self._config = config
         self._client: CdpClient | None = None
+        self._client_lock = asyncio.Lock()
         
         # Track created accounts (Coinbase doesn't have list_accounts)
         self._accounts: dict[str, WalletInfo] = {}
         self._wallet_sets: dict[str, WalletSetInfo] = {}
+        
+        # Optional write-through persistence for the registries above
+        self._storage = storage
+        self._registry_loaded = storage is None
+        self._registry_lock = asyncio.Lock()
+        
+        # CDP account objects keyed by (wallet_id, chain_type)
+        self._account_cache: AsyncTTLCache[tuple[str, str], Any] = AsyncTTLCache(
+            ttl=config.account_cache_ttl
+        )
+        # Token balances keyed by (wallet_id, network)
+        self._balance_cache: AsyncTTLCache[tuple[str, str], list[TokenBalance]] = AsyncTTLCache(
+            ttl=config.balance_ttl
+        )
+        # CDP account listings keyed by chain type
+        self._listing_cache: AsyncTTLCache[str, list[Any]] = AsyncTTLCache(
+            ttl=config.list_ttl
+        )
+        self._breaker = _CircuitBreaker(config.breaker_threshold, config.breaker_cooldown)
+        
+        # Function selector and input types keyed by (contract_address,
+        # function_name, arity); the arity tells overloads apart
+        self._selector_cache: dict[tuple[str, str, int], tuple[bytes, list[str]]] = {}
     
     async def _ensure_client(self) -> CdpClient:
-        """Lazily initialize the CDP client."""
-        if self._client is None:
+        """
+        Lazily initialize the CDP client.
+        
+        The client's session is entered once and reused by every call,
+        keeping HTTP connections alive. close() exits it.
+        """
+        if self._client is not None:
+            return self._client
+        
+        async with self._client_lock:
+            if self._client is None:
+                try:
+                    # CDP SDK reads from env vars or we can pass explicitly
+                    if self._config.api_key and self._config.api_secret:
+                        client = CdpClient(
+                            api_key_id=self._config.api_key,
+                            api_key_secret=self._config.api_secret,
+                            wallet_secret=self._config.wallet_secret,
+                        )
+                    else:
+                        # Let CDP SDK read from environment
+                        client = CdpClient()
+                    await client.__aenter__()
+                except Exception as e:
+                    raise ConfigurationError(
+                        f"Failed to initialize Coinbase CDP client: {e}",
+                        details={"error": str(e)},
+                    ) from e
+                self._client = client
+        return self._client
+    
+    async def _cdp_call(
+        self,
+        call: Callable[[], Awaitable[T]],
+        *,
+        write: bool = False,
+    ) -> T:
+        """
+        Await a CDP SDK call with retries and a circuit breaker.
+        
+        Rate-limited and gateway errors (429/502/503/504) are retried after
+        the Retry-After delay, or exponential backoff with jitter, up to
+        ``max_retries`` times. Writes are only retried on 429. Repeated
+        transient failures open the breaker so later calls fail fast.
+        
+        Raises:
+            NetworkError: If the circuit breaker is open
+        """
+        if not self._breaker.allow():
+            raise NetworkError("Coinbase CDP unavailable: circuit breaker open")
+        
+        retry_statuses = _WRITE_RETRY_STATUSES if write else RETRY_STATUSES
+        attempt = 0
+        while True:
             try:
-                # CDP SDK reads from env vars or we can pass explicitly
-                if self._config.api_key and self._config.api_secret:
-                    self._client = CdpClient(
-                        api_key_id=self._config.api_key,
-                        api_key_secret=self._config.api_secret,
-                        wallet_secret=self._config.wallet_secret,
-                    )
-                else:
-                    # Let CDP SDK read from environment
-                    self._client = CdpClient()
+                result = await call()
             except Exception as e:
-                raise ConfigurationError(
-                    f"Failed to initialize Coinbase CDP client: {e}",
-                    details={"error": str(e)},
-                ) from e
-        return self._client
+                status = error_status(e)
+                if status not in RETRY_STATUSES:
+                    raise
+                if status not in retry_statuses or attempt >= self._config.max_retries:
+                    self._breaker.record_failure()
+                    raise
+                await asyncio.sleep(retry_delay(e, attempt))
+                attempt += 1
+            else:
+                self._breaker.record_success()
+                return result
+    
+    async def _get_account(self, wallet_id: str, chain_type: str) -> Any:
+        """Get the CDP account object for a wallet, resolving it at most once per TTL."""
+        client = await self._ensure_client()
+        namespace = client.solana if chain_type == "solana" else client.evm
+        return await self._account_cache.get_or_load(
+            (wallet_id, chain_type),
+            lambda: self._cdp_call(lambda: namespace.get_or_create_account(name=wallet_id)),
+        )
+    
+    async def _ensure_registry(self) -> None:
+        """Load persisted accounts and wallet sets once, on first use."""
+        if self._registry_loaded:
+            return
+        
+        async with self._registry_lock:
+            if self._registry_loaded:
+                return
+            for data in await self._storage.query(_ACCOUNTS_COLLECTION):
+                self._accounts.setdefault(data["id"], _wallet_from_record(data))
+            for data in await self._storage.query(_WALLET_SETS_COLLECTION):
+                self._wallet_sets.setdefault(data["id"], _wallet_set_from_record(data))
+            self._registry_loaded = True
+    
+    async def _persist_account(self, wallet_info: WalletInfo) -> None:
+        if self._storage is not None:
+            await self._storage.save(
+                _ACCOUNTS_COLLECTION, wallet_info.id, _wallet_to_record(wallet_info)
+            )
+    
+    async def _persist_wallet_set(self, wallet_set: WalletSetInfo) -> None:
+        if self._storage is not None:
+            await self._storage.save(
+                _WALLET_SETS_COLLECTION, wallet_set.id, _wallet_set_to_record(wallet_set)
+            )
+    
+    def _encode_call(
+        self,
+        contract_address: str,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        params: list[Any],
+    ) -> str:
+        """
+        ABI-encode a contract call as hex calldata.
+        
+        The selector and input types are resolved from the ABI once per
+        contract, function and argument count, then reused. Overloads are
+        matched by argument count.
+        """
+        if abi_encode is None:
+            raise ConfigurationError(
+                "eth-abi not installed. Run: pip install paykit[coinbase]"
+            )
+        
+        key = (contract_address.lower(), function_name, len(params))
+        cached = self._selector_cache.get(key)
+        if cached is None:
+            for item in abi:
+                if (
+                    item.get("type") == "function"
+                    and item.get("name") == function_name
+                    and len(item.get("inputs", [])) == len(params)
+                ):
+                    types = [_abi_type(inp) for inp in item.get("inputs", [])]
+                    break
+            else:
+                raise WalletError(f"Function not found in ABI: {function_name}")
+            selector = keccak(text=f"{function_name}({','.join(types)})")[:4]
+            cached = self._selector_cache[key] = (selector, types)
+        
+        selector, types = cached
+        return "0x" + (selector + abi_encode(types, params)).hex()
     
     @property
     def provider_type(self) -> ProviderType:
         return ProviderType.COINBASE
     
     @property
-    def supported_blockchains(self) -> list[str]:
-        return list(BLOCKCHAIN_MAPPING.keys())
+    def supported_blockchains(self) -> tuple[str, ...]:
+        return SUPPORTED_BLOCKCHAINS
     
     def _to_coinbase_network(self, blockchain: str) -> str:
         """Convert standard blockchain name to Coinbase network name."""
-        return BLOCKCHAIN_MAPPING.get(blockchain.upper(), blockchain.lower())
+        network = _NET_LOOKUP.get(blockchain)
+        if network is None:
+            return _NET_LOOKUP.get(blockchain.upper(), blockchain.lower())
+        return network
     
     def _from_coinbase_network(self, network: str) -> str:
         """Convert Coinbase network name to standard blockchain name."""
-        return COINBASE_TO_STANDARD.get(network, network.upper())
+        blockchain = _STD_LOOKUP.get(network)
+        if blockchain is None:
+            return _STD_LOOKUP.get(network.lower(), network.upper())
+        return blockchain
     
     # =========================================================================
     # Wallet Set Operations
@@ -157,6 +506,7 @@ class CoinbaseProvider(WalletProvider):
         Note: Coinbase doesn't have wallet sets, so we simulate them
         using a local registry based on account naming conventions.
         """
+        await self._ensure_registry()
         return list(self._wallet_sets.values())
     
     async def create_wallet_set(self, name: str) -> WalletSetInfo:
@@ -167,8 +517,7 @@ class CoinbaseProvider(WalletProvider):
         by tracking them locally and using the set name as a prefix
         for account names.
         """
-        import uuid
-        wallet_set_id = f"coinbase-set-{uuid.uuid4().hex[:8]}"
+        wallet_set_id = f"coinbase-set-{secrets.token_hex(4)}"
         
         wallet_set = WalletSetInfo(
             id=wallet_set_id,
@@ -178,10 +527,12 @@ class CoinbaseProvider(WalletProvider):
             raw={"simulated": True},
         )
         self._wallet_sets[wallet_set_id] = wallet_set
+        await self._persist_wallet_set(wallet_set)
         return wallet_set
     
     async def get_wallet_set(self, wallet_set_id: str) -> WalletSetInfo | None:
         """Get a wallet set by ID."""
+        await self._ensure_registry()
         return self._wallet_sets.get(wallet_set_id)
     
     # =========================================================================
@@ -192,14 +543,57 @@ class CoinbaseProvider(WalletProvider):
         """
         List wallets, optionally filtered by wallet set.
         
-        Note: Returns wallets from local registry. Coinbase doesn't
-        provide a list_accounts API, so we track created accounts.
+        Note: Wallet sets are simulated locally, so filtered results come
+        from the local registry. Unfiltered results also include named
+        accounts listed from CDP, so existing accounts are visible after a
+        cold start. The CDP listing is reused for ``list_ttl`` seconds; if
+        CDP can't be reached, only the local registry is returned.
         """
+        await self._ensure_registry()
         if wallet_set_id:
             return [w for w in self._accounts.values() 
                     if w.raw.get("wallet_set_id") == wallet_set_id]
+        
+        try:
+            evm_accounts, sol_accounts = await asyncio.gather(
+                self._listing_cache.get_or_load("evm", lambda: self._list_accounts("evm")),
+                self._listing_cache.get_or_load("solana", lambda: self._list_accounts("solana")),
+            )
+        except ConfigurationError:
+            # Bad credentials aren't an outage; don't hide them
+            raise
+        except Exception as e:
+            logger.warning(f"Listing Coinbase accounts failed, using local registry: {e}")
+            return list(self._accounts.values())
+        
+        # EVM first, matching get_wallet() when a name exists on both chains
+        discovered = []
+        for chain_type, accounts in (("evm", evm_accounts), ("solana", sol_accounts)):
+            for account in accounts:
+                name = getattr(account, "name", None)
+                if name and name not in self._accounts:
+                    discovered.append(self._register_account(name, chain_type, account))
+        # Persist the new accounts together rather than one await at a time
+        await asyncio.gather(*(self._persist_account(w) for w in discovered))
         return list(self._accounts.values())
     
+    async def _list_accounts(self, chain_type: str) -> list[Any]:
+        """Fetch every CDP account on one chain type, page by page."""
+        client = await self._ensure_client()
+        namespace = client.solana if chain_type == "solana" else client.evm
+        accounts: list[Any] = []
+        page_token = None
+        while True:
+            page = await self._cdp_call(
+                lambda token=page_token: namespace.list_accounts(
+                    page_size=_LIST_PAGE_SIZE, page_token=token
+                )
+            )
+            accounts.extend(page.accounts)
+            page_token = page.next_page_token
+            if not page_token:
+                return accounts
+    
     async def create_wallet(
         self,
         wallet_set_id: str,
@@ -214,95 +608,158 @@ class CoinbaseProvider(WalletProvider):
             blockchain: Target blockchain (e.g., "BASE-SEPOLIA", "SOL-DEVNET")
             name: Optional account name
         """
-        import uuid
-        
         client = await self._ensure_client()
         chain_type = _map_blockchain_type(blockchain)
         network = self._to_coinbase_network(blockchain)
         
         # Generate a unique name if not provided
-        account_name = name or f"paykit-{uuid.uuid4().hex[:8]}"
+        account_name = name or f"paykit-{secrets.token_hex(4)}"
         
         try:
-            async with client:
-                if chain_type == "solana":
-                    account = await client.solana.create_account(name=account_name)
-                else:
-                    account = await client.evm.create_account(name=account_name)
-                
-                wallet_info = WalletInfo(
-                    id=account_name,  # Use name as ID since Coinbase uses addresses
-                    address=account.address,
-                    blockchain=blockchain,
-                    name=account_name,
-                    state="LIVE",
-                    provider=ProviderType.COINBASE,
-                    raw={
-                        "wallet_set_id": wallet_set_id,
-                        "network": network,
-                        "chain_type": chain_type,
-                    },
-                )
-                
-                self._accounts[account_name] = wallet_info
-                return wallet_info
+            namespace = client.solana if chain_type == "solana" else client.evm
+            account = await self._cdp_call(
+                lambda: namespace.create_account(name=account_name), write=True
+            )
                 
+            wallet_info = WalletInfo(
+                id=account_name,  # Use name as ID since Coinbase uses addresses
+                address=account.address,
+                blockchain=blockchain,
+                name=account_name,
+                state="LIVE",
+                provider=ProviderType.COINBASE,
+                raw={
+                    "wallet_set_id": wallet_set_id,
+                    "network": network,
+                    "chain_type": chain_type,
+                },
+            )
+            
+            self._accounts[account_name] = wallet_info
+            self._account_cache.set((account_name, chain_type), account)
         except Exception as e:
             raise WalletError(f"Failed to create Coinbase account: {e}")
+        
+        await self._persist_account(wallet_info)
+        return wallet_info
+    
+    async def create_wallets(
+        self,
+        wallet_set_id: str,
+        blockchain: str,
+        count: int,
+        names: list[str | None] | None = None,
+        *,
+        concurrency: int = 10,
+    ) -> list[WalletInfo]:
+        """
+        Create several accounts concurrently.
+        
+        CDP has no bulk account endpoint, so this issues at most
+        ``concurrency`` create_account calls at once.
+        """
+        # Initialize once up front rather than from every task
+        await self._ensure_client()
+        return await super().create_wallets(
+            wallet_set_id, blockchain, count, names, concurrency=concurrency
+        )
     
     async def get_wallet(self, wallet_id: str) -> WalletInfo | None:
         """
         Get a wallet by ID (account name).
         
-        First checks local registry, then tries to get from Coinbase.
+        Checks the local registry, then looks the name up on EVM and
+        Solana concurrently (EVM wins if both exist). Unknown names are
+        created, EVM first.
+        
+        Raises:
+            WalletError: If CDP fails for a reason other than rejecting the
+                name, such as an auth or network error
         """
         # Check local registry first
+        await self._ensure_registry()
         if wallet_id in self._accounts:
             return self._accounts[wallet_id]
         
-        # Try to get/create from Coinbase
         client = await self._ensure_client()
-        try:
-            async with client:
-                # Try EVM first
-                try:
-                    account = await client.evm.get_or_create_account(name=wallet_id)
-                    wallet_info = WalletInfo(
-                        id=wallet_id,
-                        address=account.address,
-                        blockchain="ETH",  # Default, will be updated on use
-                        name=wallet_id,
-                        state="LIVE",
-                        provider=ProviderType.COINBASE,
-                        raw={"chain_type": "evm"},
-                    )
-                    self._accounts[wallet_id] = wallet_info
-                    return wallet_info
-                except Exception:
-                    pass
-                
-                # Try Solana
-                try:
-                    account = await client.solana.get_or_create_account(name=wallet_id)
-                    wallet_info = WalletInfo(
-                        id=wallet_id,
-                        address=account.address,
-                        blockchain="SOL",
-                        name=wallet_id,
-                        state="LIVE",
-                        provider=ProviderType.COINBASE,
-                        raw={"chain_type": "solana"},
-                    )
-                    self._accounts[wallet_id] = wallet_info
-                    return wallet_info
-                except Exception:
-                    pass
-                    
-        except Exception:
-            pass
+        evm_result, sol_result = await asyncio.gather(
+            client.evm.get_account(name=wallet_id),
+            client.solana.get_account(name=wallet_id),
+            return_exceptions=True,
+        )
+        for chain_type, result in (("evm", evm_result), ("solana", sol_result)):
+            if not isinstance(result, BaseException):
+                return await self._remember_account(wallet_id, chain_type, result)
+        for result in (evm_result, sol_result):
+            if not _is_rejection(result):
+                raise WalletError(f"Failed to look up Coinbase account: {result}") from result
+        
+        # Not found on either chain: get or create it from Coinbase
+        for chain_type, namespace in (("evm", client.evm), ("solana", client.solana)):
+            try:
+                account = await namespace.get_or_create_account(name=wallet_id)
+            except Exception as e:
+                if _is_rejection(e):
+                    continue
+                raise WalletError(f"Failed to get Coinbase account: {e}") from e
+            return await self._remember_account(wallet_id, chain_type, account)
         
         return None
     
+    async def _remember_account(
+        self,
+        wallet_id: str,
+        chain_type: str,
+        account: Any,
+    ) -> WalletInfo:
+        """Register and persist a resolved CDP account and return its WalletInfo."""
+        wallet_info = self._register_account(wallet_id, chain_type, account)
+        await self._persist_account(wallet_info)
+        return wallet_info
+    
+    def _register_account(self, wallet_id: str, chain_type: str, account: Any) -> WalletInfo:
+        """Add a resolved CDP account to the in-memory registry and caches."""
+        wallet_info = WalletInfo(
+            id=wallet_id,
+            address=account.address,
+            # Default chain, will be updated on use
+            blockchain="SOL" if chain_type == "solana" else "ETH",
+            name=wallet_id,
+            state="LIVE",
+            provider=ProviderType.COINBASE,
+            raw={"chain_type": chain_type},
+        )
+        self._accounts[wallet_id] = wallet_info
+        self._account_cache.set((wallet_id, chain_type), account)
+        return wallet_info
+    
+    async def _resolve(
+        self,
+        wallet_id: str,
+        chain_type: str | None = None,
+    ) -> tuple[WalletInfo, Any, str, str]:
+        """
+        Resolve a wallet, its CDP account object, chain type and network.
+        
+        Discovery in get_wallet() seeds the account cache, so a wallet seen
+        for the first time costs no second lookup for its account.
+        
+        Raises:
+            WalletError: If the wallet or its account can't be resolved
+        """
+        wallet = await self.get_wallet(wallet_id)
+        if not wallet:
+            raise WalletError(f"Wallet not found: {wallet_id}")
+        
+        network = wallet.raw.get("network") or self._to_coinbase_network(wallet.blockchain)
+        if chain_type is None:
+            chain_type = wallet.raw.get("chain_type") or _map_blockchain_type(wallet.blockchain)
+        try:
+            account = await self._get_account(wallet_id, chain_type)
+        except Exception as e:
+            raise WalletError(f"Failed to resolve Coinbase account: {e}")
+        return wallet, account, chain_type, network
+    
     # =========================================================================
     # Balance Operations
     # =========================================================================
@@ -313,39 +770,66 @@ class CoinbaseProvider(WalletProvider):
         
         Uses Coinbase's list_token_balances action.
         """
-        wallet = await self.get_wallet(wallet_id)
-        if not wallet:
-            raise WalletError(f"Wallet not found: {wallet_id}")
-        
-        client = await self._ensure_client()
-        network = wallet.raw.get("network", self._to_coinbase_network(wallet.blockchain))
-        chain_type = wallet.raw.get("chain_type", _map_blockchain_type(wallet.blockchain))
+        wallet, account, _, network = await self._resolve(wallet_id)
+        balances = await self._balance_cache.get_or_load(
+            (wallet_id, network),
+            lambda: self._fetch_balances(wallet, account, network),
+        )
+        # Copy so callers can't mutate the cached list
+        return list(balances)
+    
+    async def get_raw_balances(self, wallet_id: str) -> list[Any]:
+        """
+        Get the CDP SDK balance objects for a wallet.
         
+        Unlike get_balances(), results are not cached or converted.
+        """
+        _, account, _, network = await self._resolve(wallet_id)
         try:
-            async with client:
-                if chain_type == "solana":
-                    account = await client.solana.get_or_create_account(name=wallet_id)
-                else:
-                    account = await client.evm.get_or_create_account(name=wallet_id)
-                
-                # Get token balances
-                balances = await account.list_token_balances(network=network)
-                
-                result = []
-                for balance in balances:
-                    result.append(TokenBalance(
-                        token_id=balance.token.contract_address or balance.token.symbol,
-                        token_symbol=balance.token.symbol,
-                        amount=Decimal(str(balance.amount)),
-                        blockchain=wallet.blockchain,
-                        raw={"balance": balance},
-                    ))
-                
-                return result
-                
+            return await self._list_token_balances(account, network)
+        except Exception as e:
+            raise WalletError(f"Failed to get balances: {e}")
+    
+    async def _list_token_balances(self, account: Any, network: str) -> list[Any]:
+        result = await self._cdp_call(
+            lambda: account.list_token_balances(network=network)
+        )
+        return list(getattr(result, "balances", result))
+    
+    async def _fetch_balances(
+        self,
+        wallet: WalletInfo,
+        account: Any,
+        network: str,
+    ) -> list[TokenBalance]:
+        try:
+            balances = await self._list_token_balances(account, network)
+            
+            # Keep only primitives in raw so cached lists don't pin SDK objects
+            return [
+                TokenBalance(
+                    token_id=balance.token.contract_address or balance.token.symbol or "",
+                    token_symbol=balance.token.symbol or "",
+                    amount=_token_amount(balance.amount),
+                    blockchain=wallet.blockchain,
+                    raw={
+                        "contract": balance.token.contract_address,
+                        "decimals": getattr(balance.amount, "decimals", None),
+                    },
+                )
+                for balance in balances
+            ]
+            
         except Exception as e:
             raise WalletError(f"Failed to get balances: {e}")
     
+    def invalidate_balances(self, wallet_id: str) -> None:
+        """Drop cached balances for a wallet so the next read hits Coinbase."""
+        wallet = self._accounts.get(wallet_id)
+        if wallet is not None:
+            network = wallet.raw.get("network") or self._to_coinbase_network(wallet.blockchain)
+            self._balance_cache.invalidate((wallet_id, network))
+    
     # =========================================================================
     # Transfer Operations
     # =========================================================================
@@ -363,47 +847,36 @@ class CoinbaseProvider(WalletProvider):
         
         Uses Coinbase's account.transfer() method.
         """
-        wallet = await self.get_wallet(wallet_id)
-        if not wallet:
-            raise WalletError(f"Wallet not found: {wallet_id}")
-        
-        client = await self._ensure_client()
-        network = wallet.raw.get("network", self._to_coinbase_network(wallet.blockchain))
-        chain_type = wallet.raw.get("chain_type", _map_blockchain_type(wallet.blockchain))
+        _, account, chain_type, network = await self._resolve(wallet_id)
         
         try:
-            async with client:
-                if chain_type == "solana":
-                    account = await client.solana.get_or_create_account(name=wallet_id)
-                else:
-                    account = await client.evm.get_or_create_account(name=wallet_id)
-                
-                # Convert USDC amount to atomic units (6 decimals)
-                if token_symbol.upper() == "USDC":
-                    atomic_amount = int(amount * Decimal("1000000"))
-                else:
-                    # For ETH/SOL, use 18 decimals for ETH, 9 for SOL
-                    if chain_type == "solana":
-                        atomic_amount = int(amount * Decimal("1000000000"))  # 9 decimals
-                    else:
-                        atomic_amount = int(amount * Decimal("1000000000000000000"))  # 18 decimals
-                
-                # Execute transfer
-                tx_hash = await account.transfer(
+            # Convert to atomic units: USDC has 6 decimals, SOL 9, ETH 18;
+            # other tokens use the chain's native precision
+            scale = _SCALES.get(token_symbol.upper()) or (
+                _SOL_SCALE if chain_type == "solana" else _ETH_SCALE
+            )
+            atomic_amount = _to_atomic(amount, scale)
+            
+            # Execute transfer
+            tx_hash = await self._cdp_call(
+                lambda: account.transfer(
                     to=recipient,
                     amount=atomic_amount,
                     token=token_symbol.lower(),
                     network=network,
-                )
-                
-                return TransactionResult(
-                    id=tx_hash,
-                    state=TransactionState.PENDING,
-                    tx_hash=tx_hash,
-                    amount=amount,
-                    raw={"network": network, "token": token_symbol},
-                )
-                
+                ),
+                write=True,
+            )
+            self._balance_cache.invalidate((wallet_id, network))
+            
+            return TransactionResult(
+                id=tx_hash,
+                state=TransactionState.PENDING,
+                tx_hash=tx_hash,
+                amount=amount,
+                raw={"network": network, "token": token_symbol},
+            )
+            
         except Exception as e:
             raise WalletError(f"Failed to transfer: {e}")
     
@@ -440,38 +913,34 @@ class CoinbaseProvider(WalletProvider):
         
         Uses Coinbase's send_transaction for contract calls.
         """
-        wallet = await self.get_wallet(wallet_id)
-        if not wallet:
-            raise WalletError(f"Wallet not found: {wallet_id}")
-        
+        _, account, _, network = await self._resolve(wallet_id, chain_type="evm")
         client = await self._ensure_client()
-        network = wallet.raw.get("network", self._to_coinbase_network(wallet.blockchain))
         
         try:
-            async with client:
-                account = await client.evm.get_or_create_account(name=wallet_id)
-                
-                # Build the transaction data
-                # This is a simplified version - in production you'd use web3.py to encode
-                from cdp.evm_transaction_types import TransactionRequestEIP1559
-                
-                tx_hash = await client.evm.send_transaction(
+            data = self._encode_call(contract_address, abi, function_name, params)
+            
+            tx_hash = await self._cdp_call(
+                lambda: client.evm.send_transaction(
                     address=account.address,
                     transaction=TransactionRequestEIP1559(
                         to=contract_address,
                         value=int(value),
-                        data="0x",  # Would need to encode function call
+                        data=data,
                     ),
                     network=network,
-                )
-                
-                return ContractCallResult(
-                    id=tx_hash,
-                    state=TransactionState.PENDING,
-                    tx_hash=tx_hash,
-                    raw={"network": network, "contract": contract_address},
-                )
-                
+                ),
+                write=True,
+            )
+            # The call may move tokens out of this wallet
+            self.invalidate_balances(wallet_id)
+            
+            return ContractCallResult(
+                id=tx_hash,
+                state=TransactionState.PENDING,
+                tx_hash=tx_hash,
+                raw={"network": network, "contract": contract_address},
+            )
+            
         except Exception as e:
             raise WalletError(f"Failed to execute contract: {e}")
     
@@ -480,5 +949,16 @@ class CoinbaseProvider(WalletProvider):
     # =========================================================================
     
     async def close(self) -> None:
-        """Clean up the CDP client."""
-        self._client = None
+        """
+        Close the CDP client's session.
+        
+        Cached account objects, listings and balances are dropped since they
+        belong to the closed client. The wallet registry is kept, so the provider can
+        be reused and will open a new session on demand.
+        """
+        client, self._client = self._client, None
+        self._account_cache.invalidate()
+        self._listing_cache.invalidate()
+        self._balance_cache.invalidate()
+        if client is not None:
+            await client.__aexit__(None, None, None)
@@ -0,0 +1,32 @@
+"""
+Retry helpers shared by wallet providers.
+
+Providers retry rate-limited and gateway errors from their SDKs with
+exponential backoff, honouring the server's Retry-After header.
+"""
+
+from __future__ import annotations
+
+import random
+
+# Rate-limited and gateway errors worth retrying
+RETRY_STATUSES = frozenset({429, 502, 503, 504})
+
+
+def error_status(error: BaseException) -> int | None:
+    """HTTP status carried by an SDK exception, if any."""
+    # CDP's ApiError exposes http_code; generated OpenAPI exceptions use status
+    status = getattr(error, "http_code", None) or getattr(error, "status", None)
+    return status if isinstance(status, int) else None
+
+
+def retry_delay(error: BaseException, attempt: int) -> float:
+    """Delay before retrying, from Retry-After or exponential backoff with jitter."""
+    headers = getattr(error, "headers", None) or {}
+    retry_after = headers.get("Retry-After")
+    if retry_after is not None:
+        try:
+            return max(float(retry_after), 0.0)
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return min(2.0 ** attempt, 30.0) * random.uniform(0.5, 1.0)
@@ -0,0 +1,1184 @@
+"""
+Unit tests for the wallet provider abstraction.
+
+Uses an in-memory provider so no vendor SDK or network access is needed.
+"""
+
+import asyncio
+import base64
+import subprocess
+import sys
+import threading
+import time
+from decimal import Decimal
+from enum import Enum
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import padding, rsa
+
+from paykit.providers.base import (
+    ContractCallResult,
+    ProviderType,
+    TokenBalance,
+    TransactionResult,
+    TransactionState,
+    WalletInfo,
+    WalletProvider,
+    WalletSetInfo,
+    ensure_raw,
+)
+
+
+class FakeProvider(WalletProvider):
+    """Minimal in-memory provider for exercising base-class behaviour."""
+
+    def __init__(self, balances: dict[str, list[TokenBalance]] | None = None) -> None:
+        self.balances = balances or {}
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.closed = False
+
+    @property
+    def provider_type(self) -> ProviderType:
+        return ProviderType.CIRCLE
+
+    @property
+    def supported_blockchains(self) -> tuple[str, ...]:
+        return ("ETH-SEPOLIA",)
+
+    async def list_wallet_sets(self) -> list[WalletSetInfo]:
+        return []
+
+    async def create_wallet_set(self, name: str) -> WalletSetInfo:
+        return WalletSetInfo(id="ws-1", name=name)
+
+    async def get_wallet_set(self, wallet_set_id: str) -> WalletSetInfo | None:
+        return None
+
+    async def list_wallets(self, wallet_set_id: str | None = None) -> list[WalletInfo]:
+        return []
+
+    async def create_wallet(
+        self,
+        wallet_set_id: str,
+        blockchain: str,
+        name: str | None = None,
+    ) -> WalletInfo:
+        return WalletInfo(id="w-1", address="0x1", blockchain=blockchain, name=name)
+
+    async def get_wallet(self, wallet_id: str) -> WalletInfo | None:
+        return None
+
+    async def get_balances(self, wallet_id: str) -> list[TokenBalance]:
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return self.balances.get(wallet_id, [])
+        finally:
+            self.in_flight -= 1
+
+    async def transfer(
+        self,
+        wallet_id: str,
+        recipient: str,
+        amount: Decimal,
+        token_symbol: str = "USDC",
+        idempotency_key: str | None = None,
+    ) -> TransactionResult:
+        return TransactionResult(id="tx-1", state=TransactionState.PENDING, amount=amount)
+
+    async def get_transaction(self, transaction_id: str) -> TransactionResult | None:
+        return None
+
+    async def execute_contract(
+        self,
+        wallet_id: str,
+        contract_address: str,
+        abi: list[dict[str, Any]],
+        function_name: str,
+        params: list[Any],
+        value: str = "0",
+    ) -> ContractCallResult:
+        return ContractCallResult(id="tx-1", state=TransactionState.PENDING)
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+def _usdc(amount: str) -> TokenBalance:
+    return TokenBalance(
+        token_id="usdc-id",
+        token_symbol="USDC",
+        amount=Decimal(amount),
+        blockchain="ETH-SEPOLIA",
+    )
+
+
+async def _echo_wallets(wallet_set_id: str | None = None) -> list[WalletInfo]:
+    return [WalletInfo(id=f"{wallet_set_id}/w", address="0x1", blockchain="ETH-SEPOLIA")]
+
+
+class TestBalances:
+    """Tests for balance helpers on WalletProvider."""
+
+    async def test_get_usdc_balance(self):
+        provider = FakeProvider({"w-1": [_usdc("5.5")]})
+        assert await provider.get_usdc_balance("w-1") == Decimal("5.5")
+        assert await provider.get_usdc_balance("missing") == Decimal("0")
+
+    async def test_get_balance_of(self):
+        eth = TokenBalance(
+            token_id="eth", token_symbol="ETH", amount=Decimal("2"), blockchain="ETH-SEPOLIA"
+        )
+        provider = FakeProvider({"w-1": [_usdc("5.5"), eth]})
+        assert await provider.get_balance_of("w-1", "eth") == Decimal("2")
+        assert await provider.get_balance_of("w-1", "SOL") == Decimal("0")
+
+    async def test_get_balances_many_preserves_order(self):
+        provider = FakeProvider({"a": [_usdc("1")], "b": [], "c": [_usdc("3")]})
+        results = await provider.get_balances_many(["c", "a", "b"])
+        assert [[b.amount for b in r] for r in results] == [
+            [Decimal("3")],
+            [Decimal("1")],
+            [],
+        ]
+
+    async def test_get_balances_many_bounds_concurrency(self):
+        provider = FakeProvider()
+        await provider.get_balances_many([f"w-{i}" for i in range(10)], concurrency=3)
+        assert provider.max_in_flight == 3
+
+    async def test_list_wallets_many_preserves_order(self):
+        provider = FakeProvider()
+        provider.list_wallets = _echo_wallets
+        results = await provider.list_wallets_many(["ws-b", "ws-a"])
+        assert [[w.id for w in r] for r in results] == [["ws-b/w"], ["ws-a/w"]]
+
+    async def test_create_wallets_default_assigns_names_in_order(self):
+        provider = FakeProvider()
+        wallets = await provider.create_wallets("ws-1", "ETH-SEPOLIA", 2, ["a", "b"])
+        assert [w.name for w in wallets] == ["a", "b"]
+        with pytest.raises(ValueError):
+            await provider.create_wallets("ws-1", "ETH-SEPOLIA", 2, ["a"])
+
+    async def test_get_usdc_balance_many(self):
+        provider = FakeProvider({"a": [_usdc("1")], "b": [_usdc("2")]})
+        amounts = await provider.get_usdc_balance_many(["a", "b", "c"])
+        assert amounts == [Decimal("1"), Decimal("2"), Decimal("0")]
+
+
+class TestLifecycle:
+    """Tests for provider resource management."""
+
+    async def test_async_context_manager_closes_provider(self):
+        async with FakeProvider() as provider:
+            assert not provider.closed
+        assert provider.closed
+
+
+class TestFactory:
+    """Tests for the provider factory helpers."""
+
+    def test_coerce_provider_type(self):
+        from paykit.providers import _coerce_provider_type
+
+        assert _coerce_provider_type("circle") is ProviderType.CIRCLE
+        assert _coerce_provider_type("coinbase") is ProviderType.COINBASE
+
+    def test_coerce_unknown_provider_type(self):
+        from paykit.providers import _coerce_provider_type
+
+        with pytest.raises(ValueError, match="not a valid ProviderType"):
+            _coerce_provider_type("nope")
+
+    def test_default_provider_reads_env_until_reset(self, monkeypatch):
+        from paykit.providers import _default_provider_type, reset_env_cache
+
+        monkeypatch.setenv("PAYKIT_PROVIDER", "coinbase")
+        reset_env_cache()
+        try:
+            assert _default_provider_type() is ProviderType.COINBASE
+            monkeypatch.setenv("PAYKIT_PROVIDER", "circle")
+            assert _default_provider_type() is ProviderType.COINBASE
+            reset_env_cache()
+            assert _default_provider_type() is ProviderType.CIRCLE
+        finally:
+            monkeypatch.undo()
+            reset_env_cache()
+
+    def test_vendor_modules_are_imported_lazily(self):
+        code = (
+            "import sys, paykit.providers as p\n"
+            "assert 'paykit.providers.coinbase' not in sys.modules\n"
+            "assert p.CoinbaseConfig.__name__ == 'CoinbaseConfig'\n"
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+    def test_registered_provider_is_constructed_by_factory(self, monkeypatch):
+        from paykit import providers
+
+        class ConfiguredProvider(FakeProvider):
+            def __init__(self, config):
+                super().__init__()
+                self.config = config
+
+        # Restore the real Coinbase entry after the test
+        original = providers._PROVIDERS[ProviderType.COINBASE]
+        monkeypatch.setitem(providers._PROVIDERS, ProviderType.COINBASE, original)
+        providers.register_provider(ProviderType.COINBASE, ConfiguredProvider)
+
+        provider = providers.get_provider("coinbase", api_key="k", region="eu")
+        assert isinstance(provider, ConfiguredProvider)
+        assert provider.config.api_key == "k"
+        assert provider.config.extra == {"region": "eu"}
+
+    def test_list_providers_is_cached_tuple(self):
+        from paykit.providers import list_providers
+
+        providers = list_providers()
+        assert isinstance(providers, tuple)
+        assert ProviderType.CIRCLE in providers
+        assert list_providers() is providers
+
+
+class TestRetryHelpers:
+    """Tests for the shared provider retry helpers."""
+
+    def test_error_status_reads_sdk_attributes(self):
+        from paykit.providers.retry import error_status
+
+        assert error_status(SimpleNamespace(http_code=503)) == 503
+        assert error_status(SimpleNamespace(status=429)) == 429
+        assert error_status(SimpleNamespace(status="bad")) is None
+        assert error_status(ValueError("no status")) is None
+
+    def test_retry_delay_honours_retry_after(self):
+        from paykit.providers.retry import retry_delay
+
+        assert retry_delay(SimpleNamespace(headers={"Retry-After": "3"}), 0) == 3.0
+        assert 4.0 <= retry_delay(SimpleNamespace(headers=None), 3) <= 8.0
+        assert retry_delay(SimpleNamespace(headers={}), 10) <= 30.0
+
+
+class TestAsyncTTLCache:
+    """Tests for the provider read cache."""
+
+    async def test_concurrent_misses_share_one_load(self):
+        from paykit.providers.cache import AsyncTTLCache
+
+        cache: AsyncTTLCache[str, str] = AsyncTTLCache()
+        calls = 0
+
+        async def load():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(cache.get_or_load("k", load) for _ in range(5)))
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert await cache.get_or_load("k", load) == "value"
+        assert calls == 1
+
+    async def test_none_results_are_not_cached(self):
+        from paykit.providers.cache import AsyncTTLCache
+
+        cache: AsyncTTLCache[str, str] = AsyncTTLCache()
+        calls = []
+
+        async def load():
+            calls.append(1)
+            return None
+
+        assert await cache.get_or_load("k", load) is None
+        assert await cache.get_or_load("k", load) is None
+        assert len(calls) == 2
+
+    def test_expiry_eviction_and_invalidation(self, monkeypatch):
+        from paykit.providers import cache as cache_module
+
+        now = [100.0]
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+        cache = cache_module.AsyncTTLCache(maxsize=2, ttl=10)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        assert cache.get("a") == 1
+        cache.set("c", 3)
+        assert cache.get("b") is None  # least recently used
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        now[0] += 11
+        assert cache.get("c") is None
+
+    def test_zero_ttl_disables_caching(self):
+        from paykit.providers.cache import AsyncTTLCache
+
+        cache = AsyncTTLCache(ttl=0)
+        cache.set("a", 1)
+        assert cache.get("a") is None
+
+
+class TestDataclasses:
+    """Tests for the universal provider dataclasses."""
+
+    def test_transaction_state_is_terminal(self):
+        assert TransactionState.COMPLETE.is_terminal()
+        assert TransactionState.FAILED.is_terminal()
+        assert TransactionState.CANCELLED.is_terminal()
+        assert not TransactionState.PENDING.is_terminal()
+        assert not TransactionState.CONFIRMED.is_terminal()
+
+    def test_token_symbol_is_normalized(self):
+        balance = TokenBalance(
+            token_id="x", token_symbol="usdc", amount=Decimal("1"), blockchain="BASE"
+        )
+        assert balance.token_symbol == "USDC"
+
+    def test_raw_defaults_to_shared_read_only_mapping(self):
+        a, b = _usdc("1"), _usdc("2")
+        assert a.raw is b.raw
+        with pytest.raises(TypeError):
+            a.raw["k"] = "v"
+
+    def test_ensure_raw_promotes_to_dict(self):
+        balance = _usdc("1")
+        ensure_raw(balance)["k"] = "v"
+        assert balance.raw == {"k": "v"}
+        assert _usdc("2").raw == {}
+
+    def test_records_use_slots(self):
+        balance = _usdc("1")
+        assert not hasattr(balance, "__dict__")
+        with pytest.raises(AttributeError):
+            balance.extra_field = 1
+
+
+ENTITY_SECRET = "ab" * 32
+
+
+class _Chain(str, Enum):
+    BASE = "BASE"
+
+
+class _State(str, Enum):
+    FROZEN = "FROZEN"
+
+
+def _model(**fields: Any) -> SimpleNamespace:
+    """Stand-in for a Circle SDK model exposing fields as attributes."""
+    return SimpleNamespace(**fields)
+
+
+@pytest.fixture(scope="module")
+def rsa_private_key():
+    return rsa.generate_private_key(public_exponent=65537, key_size=2048)
+
+
+@pytest.fixture
+def circle_provider(monkeypatch, rsa_private_key):
+    """CircleProvider with the SDK client and API classes mocked out."""
+    from paykit.providers import circle
+
+    pem = rsa_private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode()
+    sdk_client = MagicMock()
+    sdk_client.configuration.get_public_key.return_value = pem
+    sdk_client.configuration.connection_pool_maxsize = 10
+    utils = MagicMock()
+    utils.init_developer_controlled_wallets_client.return_value = sdk_client
+    monkeypatch.setattr(circle, "circle_utils", utils)
+    monkeypatch.setattr(circle, "circle_rest", MagicMock())
+    monkeypatch.setattr(circle, "developer_controlled_wallets", MagicMock())
+    circle.developer_controlled_wallets.ApiException = type("ApiException", (Exception,), {})
+
+    provider = circle.CircleProvider(
+        circle.CircleConfig(api_key="TEST_API_KEY:a:b", entity_secret=ENTITY_SECRET)
+    )
+    provider._wallet_sets_api = MagicMock()
+    provider._wallets_api = MagicMock()
+    provider._transactions_api = MagicMock()
+    return provider
+
+
+class TestCircleProvider:
+    """Tests for CircleProvider with the Circle SDK mocked."""
+
+    def test_ciphertext_is_fresh_and_decrypts_to_secret(self, circle_provider, rsa_private_key):
+        first = circle_provider._get_ciphertext()
+        second = circle_provider._get_ciphertext()
+        assert first != second
+
+        oaep = padding.OAEP(
+            mgf=padding.MGF1(algorithm=hashes.SHA256()), algorithm=hashes.SHA256(), label=None
+        )
+        for ciphertext in (first, second):
+            plain = rsa_private_key.decrypt(base64.b64decode(ciphertext), oaep)
+            assert plain.hex() == ENTITY_SECRET
+
+    async def test_connection_pool_is_sized_and_closed(self, circle_provider):
+        from paykit.providers import circle
+
+        # The SDK's pool is kept unless max_connections is set
+        configuration = circle_provider._client.configuration
+        circle.circle_rest.RESTClientObject.assert_not_called()
+        assert circle_provider._write_sem._value == 10
+
+        sized = circle.CircleProvider(
+            circle.CircleConfig(
+                api_key="TEST_API_KEY:a:b", entity_secret=ENTITY_SECRET, max_connections=20
+            )
+        )
+        assert configuration.connection_pool_maxsize == 20
+        circle.circle_rest.RESTClientObject.assert_called_once_with(configuration)
+        assert sized._write_sem._value == 20
+
+        async with circle_provider:
+            pass
+        circle_provider._client.rest_client.pool_manager.clear.assert_called_once()
+        circle_provider._client.close.assert_called_once()
+
+    async def test_transfer_caches_usdc_token_id(self, circle_provider):
+        token_balance = _model(
+            amount="10", token=_model(id="usdc-id", symbol="USDC", blockchain="ETH-SEPOLIA")
+        )
+        wallets_api = circle_provider._wallets_api
+        wallets_api.list_wallet_balance.return_value.data.token_balances = [token_balance]
+        circle_provider._transactions_api.create_developer_transaction_transfer.return_value \
+            .data.to_dict.return_value = {"id": "tx-1", "state": "INITIATED"}
+
+        for _ in range(2):
+            result = await circle_provider.transfer("w-1", "0xabc", Decimal("1"))
+        assert result.id == "tx-1"
+        assert wallets_api.list_wallet_balance.call_count == 1
+
+        circle_provider.invalidate_token_cache("w-1")
+        await circle_provider.transfer("w-1", "0xabc", Decimal("1"))
+        assert wallets_api.list_wallet_balance.call_count == 2
+
+    def test_to_circle_blockchain_is_case_insensitive(self, circle_provider):
+        for name in ("BASE-SEPOLIA", "base-sepolia", "Base-Sepolia"):
+            assert circle_provider._to_circle_blockchain(name) == "BASE-SEPOLIA"
+        assert circle_provider._to_circle_blockchain("unknown") == "unknown"
+
+    async def test_list_wallets_reads_models_and_fills_defaults(self, circle_provider):
+        full = _model(
+            id="w-1", address="0x1", blockchain=_Chain.BASE, name="ops", state=_State.FROZEN
+        )
+        sparse = _model(id="w-2", address=None, blockchain=None, name=None, state=None)
+        circle_provider._wallets_api.get_wallets.return_value.data.wallets = [
+            MagicMock(actual_instance=full),
+            MagicMock(actual_instance=sparse),
+        ]
+
+        first, second = await circle_provider.list_wallets()
+        assert (first.id, first.address, first.blockchain, first.name, first.state) == (
+            "w-1", "0x1", "BASE", "ops", "FROZEN"
+        )
+        assert type(first.blockchain) is str
+        assert (second.id, second.address, second.name, second.state) == ("w-2", "", None, "LIVE")
+
+    async def test_list_wallet_sets_reads_custody_type(self, circle_provider):
+        ws = _model(id="ws-1", custody_type=None)
+        circle_provider._wallet_sets_api.get_wallet_sets.return_value.data.wallet_sets = [
+            MagicMock(actual_instance=ws)
+        ]
+
+        (wallet_set,) = await circle_provider.list_wallet_sets()
+        assert (wallet_set.id, wallet_set.name, wallet_set.custody_type) == (
+            "ws-1", "", "DEVELOPER"
+        )
+
+    async def test_raw_is_materialized_on_first_read(self, circle_provider):
+        calls = []
+        balance = _model(
+            amount="1",
+            token=_model(id="t", symbol="USDC", blockchain="BASE"),
+            to_dict=lambda: calls.append(1) or {"amount": "1"},
+        )
+        circle_provider._wallets_api.list_wallet_balance.return_value.data.token_balances = [
+            balance
+        ]
+
+        (result,) = await circle_provider.get_balances("w-1")
+        assert calls == []
+        assert result.raw["amount"] == "1"
+        assert dict(result.raw) == {"amount": "1"}
+        assert calls == [1]
+
+    async def test_sdk_calls_run_off_the_event_loop(self, circle_provider):
+        loop_thread = threading.get_ident()
+        call_threads = []
+
+        def get_wallets(**kwargs):
+            call_threads.append(threading.get_ident())
+            return MagicMock(data=MagicMock(wallets=[]))
+
+        circle_provider._wallets_api.get_wallets.side_effect = get_wallets
+        assert await circle_provider.list_wallets() == []
+        assert call_threads and call_threads[0] != loop_thread
+
+    def test_abi_signature_follows_abi_contents(self, circle_provider):
+        abi = [{
+            "type": "function",
+            "name": "approve",
+            "inputs": [{"type": "address"}, {"type": "uint256"}],
+        }]
+        assert circle_provider._build_abi_signature(abi, "approve") == "approve(address,uint256)"
+        # Editing the ABI in place is picked up on the next call
+        abi[0]["inputs"] = []
+        assert circle_provider._build_abi_signature(abi, "approve") == "approve()"
+        assert circle_provider._build_abi_signature(abi, "missing") == "missing"
+
+    def test_map_transaction_state(self):
+        from paykit.providers.circle import _map_transaction_state
+
+        assert _map_transaction_state("COMPLETE") is TransactionState.COMPLETE
+        assert _map_transaction_state("denied") is TransactionState.FAILED
+        assert _map_transaction_state("Cancelled") is TransactionState.CANCELLED
+        assert _map_transaction_state("UNKNOWN") is TransactionState.PENDING
+
+    async def test_rate_limited_calls_are_retried(self, circle_provider):
+        from paykit.providers import circle
+
+        throttled = circle.developer_controlled_wallets.ApiException("slow down")
+        throttled.status = 429
+        throttled.headers = {"Retry-After": "0"}
+        circle_provider._wallets_api.get_wallets.side_effect = [
+            throttled,
+            MagicMock(data=MagicMock(wallets=[])),
+        ]
+
+        assert await circle_provider.list_wallets() == []
+        assert circle_provider._wallets_api.get_wallets.call_count == 2
+
+    async def test_retries_stop_at_max_retries(self, circle_provider):
+        from paykit.core.exceptions import WalletError
+        from paykit.providers import circle
+
+        throttled = circle.developer_controlled_wallets.ApiException("slow down")
+        throttled.status = 429
+        throttled.headers = {"Retry-After": "0"}
+        circle_provider._config.max_retries = 2
+        circle_provider._wallets_api.get_wallets.side_effect = throttled
+
+        with pytest.raises(WalletError):
+            await circle_provider.list_wallets()
+        assert circle_provider._wallets_api.get_wallets.call_count == 3
+
+    async def test_other_api_errors_are_not_retried(self, circle_provider):
+        from paykit.providers import circle
+
+        missing = circle.developer_controlled_wallets.ApiException("not found")
+        missing.status = 404
+        circle_provider._wallets_api.get_wallet.side_effect = missing
+
+        assert await circle_provider.get_wallet("w-1") is None
+        assert circle_provider._wallets_api.get_wallet.call_count == 1
+
+    async def test_token_bucket_paces_calls(self):
+        from paykit.providers.circle import _TokenBucket
+
+        bucket = _TokenBucket(rate=100, capacity=2)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for _ in range(4):
+            await bucket.acquire()
+        # Two calls ride the burst, the other two wait ~10ms each
+        assert loop.time() - start >= 0.015
+
+    async def test_create_wallets_batches_by_circle_limit(self, circle_provider):
+        from paykit.providers import circle
+
+        def create_wallet(request):
+            names = [m.get("name") for m in request.get("metadata", [{}] * request["count"])]
+            wallets = [
+                MagicMock(actual_instance=_model(
+                    id=f"w-{i}", address="0x1", blockchain="BASE", name=name, state="LIVE"
+                ))
+                for i, name in enumerate(names)
+            ]
+            return MagicMock(data=MagicMock(wallets=wallets))
+
+        requests: list[dict[str, Any]] = []
+        circle.developer_controlled_wallets.CreateWalletRequest.from_dict.side_effect = (
+            lambda body: requests.append(body) or body
+        )
+        circle_provider._wallets_api.create_wallet.side_effect = create_wallet
+
+        # Batches run concurrently, so requests may be recorded in any order
+        wallets = await circle_provider.create_wallets("ws-1", "base", 250)
+        assert sorted(r["count"] for r in requests) == [50, 200]
+        assert not any("metadata" in r for r in requests)
+        assert len(wallets) == 250
+
+        names = [f"n{i}" for i in range(250)]
+        names[1] = None
+        wallets = await circle_provider.create_wallets("ws-1", "base", 250, names)
+        first = next(r for r in requests[2:] if r["count"] == 200)
+        assert sorted(len(r["metadata"]) for r in requests[2:]) == [50, 200]
+        assert first["metadata"][:2] == [{"name": "n0"}, {}]
+        assert [w.name for w in wallets] == names
+
+        wallet = await circle_provider.create_wallet("ws-1", "base", name="ops")
+        assert requests[-1]["metadata"] == [{"name": "ops"}]
+        assert wallet.name == "ops"
+
+    def test_supports_cross_chain(self, circle_provider):
+        assert circle_provider.supports_cross_chain("ETH-SEPOLIA", "base-sepolia")
+        assert not circle_provider.supports_cross_chain("SOL", "ETH")
+
+    async def test_get_wallet_is_cached(self, circle_provider):
+        wallet = _model(id="w-1", address="0x1", blockchain="BASE", name=None, state="LIVE")
+        wallets_api = circle_provider._wallets_api
+        wallets_api.get_wallet.return_value.data.wallet.actual_instance = wallet
+
+        first = await circle_provider.get_wallet("w-1")
+        second = await circle_provider.get_wallet("w-1")
+        assert first is second
+        assert wallets_api.get_wallet.call_count == 1
+
+    def test_orjson_deserializer_feeds_sdk_model_parsing(self):
+        pytest.importorskip("orjson")
+        from paykit.providers.circle import _install_orjson_deserializer
+
+        class FakeApiClient:
+            def deserialize(self, response, response_type):
+                return ("sdk", response_type)
+
+            def _ApiClient__deserialize(self, data, klass):
+                return (data, klass)
+
+        client = FakeApiClient()
+        _install_orjson_deserializer(client)
+        assert client.deserialize(SimpleNamespace(data='{"a": [1]}'), "Wallets") == (
+            {"a": [1]}, "Wallets"
+        )
+        assert client.deserialize(SimpleNamespace(data="plain"), "str") == ("plain", "str")
+        assert client.deserialize(SimpleNamespace(data=""), "file") == ("sdk", "file")
+
+    async def test_connection_errors_raise_network_error_after_retries(
+        self, circle_provider, monkeypatch
+    ):
+        import urllib3
+
+        from paykit.core.exceptions import NetworkError
+        from paykit.providers import circle
+
+        monkeypatch.setattr(circle, "retry_delay", lambda error, attempt: 0)
+        circle_provider._config.max_retries = 1
+        circle_provider._wallets_api.get_wallets.side_effect = urllib3.exceptions.HTTPError(
+            "connection refused"
+        )
+
+        with pytest.raises(NetworkError):
+            await circle_provider.list_wallets()
+        assert circle_provider._wallets_api.get_wallets.call_count == 2
+
+    async def test_write_retries_use_fresh_ciphertext(self, circle_provider):
+        from paykit.providers import circle
+
+        throttled = circle.developer_controlled_wallets.ApiException("slow down")
+        throttled.status = 503
+        throttled.headers = {"Retry-After": "0"}
+        bodies: list[dict[str, Any]] = []
+        circle.developer_controlled_wallets.CreateWalletSetRequest.from_dict.side_effect = (
+            lambda body: bodies.append(body)
+        )
+        circle_provider._wallet_sets_api.create_wallet_set.side_effect = [
+            throttled,
+            MagicMock(data=MagicMock(wallet_set=MagicMock(
+                actual_instance=_model(id="ws-1", custody_type="DEVELOPER")
+            ))),
+        ]
+
+        await circle_provider.create_wallet_set("ops")
+        assert len(bodies) == 2
+        assert bodies[0]["entitySecretCiphertext"] != bodies[1]["entitySecretCiphertext"]
+        assert bodies[0]["idempotencyKey"] == bodies[1]["idempotencyKey"]
+
+    async def test_write_retried_after_connection_error(self, circle_provider, monkeypatch):
+        import urllib3
+
+        from paykit.providers import circle
+
+        monkeypatch.setattr(circle, "retry_delay", lambda error, attempt: 0)
+        bodies: list[dict[str, Any]] = []
+        circle.developer_controlled_wallets.CreateWalletSetRequest.from_dict.side_effect = (
+            lambda body: bodies.append(body)
+        )
+        circle_provider._wallet_sets_api.create_wallet_set.side_effect = [
+            urllib3.exceptions.HTTPError("connection reset"),
+            MagicMock(data=MagicMock(wallet_set=MagicMock(
+                actual_instance=_model(id="ws-1", custody_type="DEVELOPER")
+            ))),
+        ]
+
+        await circle_provider.create_wallet_set("ops")
+        assert bodies[0]["entitySecretCiphertext"] != bodies[1]["entitySecretCiphertext"]
+        assert bodies[0]["idempotencyKey"] == bodies[1]["idempotencyKey"]
+
+    async def test_writes_are_bounded_by_semaphore(self, circle_provider):
+        lock = threading.Lock()
+        in_flight = peak = 0
+
+        def create_wallet_set(request):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.02)
+            with lock:
+                in_flight -= 1
+            return MagicMock(data=MagicMock(wallet_set=MagicMock(
+                actual_instance=_model(id="ws-1", custody_type="DEVELOPER")
+            )))
+
+        circle_provider._write_sem = asyncio.Semaphore(2)
+        circle_provider._wallet_sets_api.create_wallet_set.side_effect = create_wallet_set
+        await asyncio.gather(*(circle_provider.create_wallet_set(f"s{i}") for i in range(6)))
+        assert peak == 2
+
+
+class _CdpApiError(Exception):
+    """Stand-in for cdp's ApiError, which carries the HTTP status as http_code."""
+
+    def __init__(self, http_code: int) -> None:
+        super().__init__(f"HTTP {http_code}")
+        self.http_code = http_code
+
+
+class FakeCdpClient:
+    """Stand-in for cdp.CdpClient recording session enter/exit."""
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.kwargs = kwargs
+        self.entered = 0
+        self.exited = 0
+        self.evm = MagicMock()
+        self.solana = MagicMock()
+        for namespace, address in ((self.evm, "0xabc"), (self.solana, "So1abc")):
+            account = MagicMock(address=address)
+            account.list_token_balances = AsyncMock(return_value=[])
+            account.transfer = AsyncMock(return_value="0xtx")
+            namespace.create_account = AsyncMock(return_value=account)
+            namespace.get_or_create_account = AsyncMock(return_value=account)
+            namespace.get_account = AsyncMock(side_effect=_CdpApiError(404))
+            namespace.list_accounts = AsyncMock(
+                return_value=SimpleNamespace(accounts=[], next_page_token=None)
+            )
+
+    async def __aenter__(self) -> "FakeCdpClient":
+        self.entered += 1
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        self.exited += 1
+
+
+@pytest.fixture
+def coinbase_provider(monkeypatch):
+    """CoinbaseProvider backed by FakeCdpClient."""
+    from paykit.providers import coinbase
+
+    monkeypatch.setattr(coinbase, "CDP_SDK_AVAILABLE", True)
+    monkeypatch.setattr(coinbase, "CdpClient", FakeCdpClient)
+    return coinbase.CoinbaseProvider(coinbase.CoinbaseConfig(api_key="k", api_secret="s"))
+
+
+class TestCoinbaseProvider:
+    """Tests for CoinbaseProvider with the CDP SDK faked."""
+
+    async def test_client_session_is_entered_once(self, coinbase_provider):
+        await asyncio.gather(
+            coinbase_provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a"),
+            coinbase_provider.create_wallet("ws-1", "BASE-SEPOLIA", name="b"),
+        )
+        await coinbase_provider.get_balances("a")
+        client = coinbase_provider._client
+        assert client.entered == 1
+
+        await coinbase_provider.close()
+        assert client.exited == 1
+        assert coinbase_provider._client is None
+
+    async def test_context_manager_closes_and_drops_accounts(self, coinbase_provider):
+        async with coinbase_provider as provider:
+            await provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a")
+            await provider.list_wallets()
+            assert provider._listing_cache.get("evm") == []
+            client = provider._client
+        assert client.exited == 1
+        assert coinbase_provider._account_cache.get(("a", "evm")) is None
+        assert coinbase_provider._listing_cache.get("evm") is None
+        assert await coinbase_provider.list_wallets() != []
+
+        # A closed provider opens a fresh session on next use
+        await coinbase_provider.get_balances("a")
+        assert coinbase_provider._client is not client
+        await coinbase_provider.close()
+
+    async def test_account_objects_are_resolved_once(self, coinbase_provider):
+        await coinbase_provider.get_balances("x")
+        await coinbase_provider.get_balances("x")
+        await coinbase_provider.transfer("x", "0xdef", Decimal("1"))
+        client = coinbase_provider._client
+        assert client.evm.get_or_create_account.await_count == 1
+
+    async def test_get_wallet_probes_both_chains_concurrently(self, coinbase_provider):
+        client = await coinbase_provider._ensure_client()
+        sol_account = MagicMock(address="So1existing")
+        client.solana.get_account = AsyncMock(return_value=sol_account)
+
+        wallet = await coinbase_provider.get_wallet("treasury")
+        assert (wallet.address, wallet.blockchain) == ("So1existing", "SOL")
+        client.evm.get_account.assert_awaited_once_with(name="treasury")
+        client.evm.get_or_create_account.assert_not_awaited()
+        assert await coinbase_provider._get_account("treasury", "solana") is sol_account
+
+    async def test_operations_reuse_discovered_account(self, coinbase_provider):
+        client = await coinbase_provider._ensure_client()
+        evm_account = MagicMock(address="0xexisting")
+        evm_account.transfer = AsyncMock(return_value="0xtx")
+        client.evm.get_account = AsyncMock(return_value=evm_account)
+
+        result = await coinbase_provider.transfer("treasury", "0xdef", Decimal("1"))
+        assert result.tx_hash == "0xtx"
+        evm_account.transfer.assert_awaited_once()
+        client.evm.get_account.assert_awaited_once_with(name="treasury")
+        client.evm.get_or_create_account.assert_not_awaited()
+
+    async def test_unknown_wallet_raises(self, coinbase_provider):
+        from paykit.core.exceptions import WalletError
+
+        client = await coinbase_provider._ensure_client()
+        client.evm.get_or_create_account.side_effect = _CdpApiError(400)
+        client.solana.get_or_create_account.side_effect = _CdpApiError(400)
+        with pytest.raises(WalletError, match="Wallet not found"):
+            await coinbase_provider.transfer("ghost", "0xdef", Decimal("1"))
+
+    async def test_get_wallet_raises_on_transport_errors(self, coinbase_provider):
+        from paykit.core.exceptions import WalletError
+
+        client = await coinbase_provider._ensure_client()
+        client.evm.get_account.side_effect = _CdpApiError(401)
+        with pytest.raises(WalletError, match="look up"):
+            await coinbase_provider.get_wallet("treasury")
+        client.evm.get_or_create_account.assert_not_awaited()
+
+        client.evm.get_account.side_effect = _CdpApiError(404)
+        client.evm.get_or_create_account.side_effect = ConnectionError("reset")
+        with pytest.raises(WalletError, match="reset"):
+            await coinbase_provider.get_wallet("treasury")
+        client.solana.get_or_create_account.assert_not_awaited()
+
+    async def test_get_wallet_creates_unknown_names_on_evm(self, coinbase_provider):
+        wallet = await coinbase_provider.get_wallet("new")
+        assert (wallet.address, wallet.blockchain) == ("0xabc", "ETH")
+        client = coinbase_provider._client
+        client.evm.get_or_create_account.assert_awaited_once_with(name="new")
+        client.solana.get_or_create_account.assert_not_awaited()
+
+    async def test_balances_are_cached_until_transfer(self, coinbase_provider):
+        await coinbase_provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a")
+        account = coinbase_provider._client.evm.create_account.return_value
+
+        first = await coinbase_provider.get_balances("a")
+        first.append("mutated")
+        assert await coinbase_provider.get_balances("a") == []
+        assert account.list_token_balances.await_count == 1
+
+        await coinbase_provider.transfer("a", "0xdef", Decimal("1"))
+        await coinbase_provider.get_balances("a")
+        assert account.list_token_balances.await_count == 2
+
+        coinbase_provider.invalidate_balances("a")
+        await coinbase_provider.get_balances("a")
+        assert account.list_token_balances.await_count == 3
+
+    async def test_list_wallets_includes_cdp_accounts(self, coinbase_provider):
+        await coinbase_provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a")
+        client = coinbase_provider._client
+        client.evm.list_accounts.side_effect = [
+            SimpleNamespace(
+                accounts=[
+                    SimpleNamespace(address="0x1", name="a"),
+                    SimpleNamespace(address="0x2", name="b"),
+                ],
+                next_page_token="p2",
+            ),
+            SimpleNamespace(
+                accounts=[SimpleNamespace(address="0x3", name=None)], next_page_token=None
+            ),
+        ]
+        client.solana.list_accounts.return_value = SimpleNamespace(
+            accounts=[
+                SimpleNamespace(address="So1b", name="b"),
+                SimpleNamespace(address="So1c", name="c"),
+            ],
+            next_page_token=None,
+        )
+
+        wallets = await coinbase_provider.list_wallets()
+        assert [(w.id, w.address) for w in wallets] == [
+            ("a", "0xabc"),
+            ("b", "0x2"),
+            ("c", "So1c"),
+        ]
+        assert client.evm.list_accounts.await_args.kwargs["page_token"] == "p2"
+        assert [w.id for w in await coinbase_provider.list_wallets("ws-1")] == ["a"]
+
+        # The CDP listing is reused within list_ttl
+        await coinbase_provider.list_wallets()
+        assert client.evm.list_accounts.await_count == 2
+        assert client.solana.list_accounts.await_count == 1
+
+    async def test_list_wallets_falls_back_to_registry(self, coinbase_provider):
+        from paykit.providers.coinbase import CoinbaseConfig, CoinbaseProvider
+        from paykit.storage import InMemoryStorage
+
+        storage = InMemoryStorage()
+        provider = CoinbaseProvider(CoinbaseConfig(api_key="k", api_secret="s"), storage)
+        await provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a")
+        client = provider._client
+        client.evm.list_accounts.return_value = SimpleNamespace(
+            accounts=[SimpleNamespace(address="0x2", name="b")], next_page_token=None
+        )
+        client.solana.list_accounts.side_effect = ConnectionError("unreachable")
+
+        assert [w.id for w in await provider.list_wallets()] == ["a"]
+
+        client.solana.list_accounts.side_effect = None
+        assert [w.id for w in await provider.list_wallets()] == ["a", "b"]
+        assert await storage.get("coinbase_accounts", "b") is not None
+
+    async def test_list_wallets_raises_on_bad_credentials(self, coinbase_provider, monkeypatch):
+        from paykit.core.exceptions import ConfigurationError
+        from paykit.providers import coinbase
+
+        def bad_client(**kwargs: Any) -> None:
+            raise ValueError("invalid API key")
+
+        monkeypatch.setattr(coinbase, "CdpClient", bad_client)
+        with pytest.raises(ConfigurationError):
+            await coinbase_provider.list_wallets()
+
+    async def test_create_wallets_in_bulk(self, coinbase_provider):
+        wallets = await coinbase_provider.create_wallets(
+            "ws-1", "SOL-DEVNET", 3, ["a", "b", "c"]
+        )
+        assert [w.id for w in wallets] == ["a", "b", "c"]
+        assert coinbase_provider._client.solana.create_account.await_count == 3
+        assert await coinbase_provider.list_wallets("ws-1") == wallets
+
+    @pytest.mark.parametrize(
+        ("blockchain", "token", "expected"),
+        [
+            ("BASE-SEPOLIA", "USDC", 1_500_000),
+            ("BASE-SEPOLIA", "ETH", 1_500_000_000_000_000_000),
+            ("SOL-DEVNET", "SOL", 1_500_000_000),
+        ],
+    )
+    async def test_transfer_scales_to_atomic_units(
+        self, coinbase_provider, blockchain, token, expected
+    ):
+        await coinbase_provider.create_wallet("ws-1", blockchain, name="a")
+        client = coinbase_provider._client
+        namespace = client.solana if blockchain.startswith("SOL") else client.evm
+        account = namespace.create_account.return_value
+
+        await coinbase_provider.transfer("a", "dest", Decimal("1.5"), token_symbol=token)
+        assert account.transfer.await_args.kwargs["amount"] == expected
+
+    async def test_registry_is_reloaded_from_storage(self, coinbase_provider):
+        from paykit.providers.coinbase import CoinbaseConfig, CoinbaseProvider
+        from paykit.storage import InMemoryStorage
+
+        storage = InMemoryStorage()
+        first = CoinbaseProvider(CoinbaseConfig(api_key="k", api_secret="s"), storage)
+        wallet_set = await first.create_wallet_set("ops")
+        await first.create_wallet(wallet_set.id, "BASE-SEPOLIA", name="a")
+        await first.get_wallet("found")
+
+        second = CoinbaseProvider(CoinbaseConfig(api_key="k", api_secret="s"), storage)
+        assert await second.get_wallet_set(wallet_set.id) == wallet_set
+        wallet = await second.get_wallet("a")
+        assert (wallet.address, wallet.raw["network"]) == ("0xabc", "base-sepolia")
+        assert second._client is None
+        assert [w.id for w in await second.list_wallets()] == ["a", "found"]
+
+    async def test_transient_errors_are_retried(self, coinbase_provider, monkeypatch):
+        from paykit.core.exceptions import WalletError
+        from paykit.providers import coinbase
+
+        monkeypatch.setattr(coinbase, "retry_delay", lambda error, attempt: 0)
+        await coinbase_provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a")
+        account = coinbase_provider._client.evm.create_account.return_value
+        account.list_token_balances.side_effect = [_CdpApiError(503), []]
+        assert await coinbase_provider.get_balances("a") == []
+        assert account.list_token_balances.await_count == 2
+
+        # Writes carry no idempotency key, so only 429 is retried
+        account.transfer.side_effect = _CdpApiError(503)
+        with pytest.raises(WalletError):
+            await coinbase_provider.transfer("a", "0xdef", Decimal("1"))
+        assert account.transfer.await_count == 1
+
+    async def test_circuit_breaker_fails_fast(self, coinbase_provider, monkeypatch):
+        from paykit.core.exceptions import WalletError
+        from paykit.providers import coinbase
+
+        monkeypatch.setattr(coinbase, "retry_delay", lambda error, attempt: 0)
+        coinbase_provider._config.max_retries = 0
+        coinbase_provider._breaker.threshold = 2
+        await coinbase_provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a")
+        account = coinbase_provider._client.evm.create_account.return_value
+        account.list_token_balances.side_effect = _CdpApiError(503)
+
+        for _ in range(3):
+            coinbase_provider.invalidate_balances("a")
+            with pytest.raises(WalletError, match="circuit breaker|503"):
+                await coinbase_provider.get_balances("a")
+        assert account.list_token_balances.await_count == 2
+
+        coinbase_provider._breaker.cooldown = 0
+        account.list_token_balances.side_effect = None
+        assert await coinbase_provider.get_balances("a") == []
+
+    def test_encode_call_caches_selector(self, coinbase_provider):
+        pytest.importorskip("eth_abi")
+        from paykit.core.exceptions import WalletError
+
+        abi = [
+            {"type": "event", "name": "Transfer", "inputs": []},
+            {
+                "type": "function",
+                "name": "transfer",
+                "inputs": [{"type": "address"}, {"type": "uint256"}],
+            },
+        ]
+        recipient = "0x" + "11" * 20
+        data = coinbase_provider._encode_call("0xUSDC", abi, "transfer", [recipient, 5])
+        assert data == "0xa9059cbb" + "0" * 24 + "11" * 20 + "0" * 63 + "5"
+        assert coinbase_provider._selector_cache[("0xusdc", "transfer", 2)][1] == [
+            "address",
+            "uint256",
+        ]
+
+        # Later calls reuse the cached selector without scanning the ABI
+        assert coinbase_provider._encode_call("0xUSDC", [], "transfer", [recipient, 5]) == data
+
+        with pytest.raises(WalletError):
+            coinbase_provider._encode_call("0xUSDC", abi, "approve", [recipient, 5])
+
+    def test_encode_call_distinguishes_overloads(self, coinbase_provider):
+        pytest.importorskip("eth_abi")
+        from eth_utils import keccak
+
+        address = {"type": "address"}
+        abi = [
+            {"type": "function", "name": "safeTransferFrom",
+             "inputs": [address, address, {"type": "uint256"}]},
+            {"type": "function", "name": "safeTransferFrom",
+             "inputs": [address, address, {"type": "uint256"}, {"type": "bytes"}]},
+        ]
+        a, b = "0x" + "11" * 20, "0x" + "22" * 20
+        three = coinbase_provider._encode_call("0xNFT", abi, "safeTransferFrom", [a, b, 1])
+        four = coinbase_provider._encode_call(
+            "0xNFT", abi, "safeTransferFrom", [a, b, 1, b"hi"]
+        )
+        selector = keccak(text="safeTransferFrom(address,address,uint256,bytes)")[:4]
+        assert three[:10] == "0x42842e0e"
+        assert four[:10] == "0x" + selector.hex()
+
+    async def test_execute_contract_invalidates_balances(self, coinbase_provider, monkeypatch):
+        pytest.importorskip("eth_abi")
+        from paykit.providers import coinbase
+
+        monkeypatch.setattr(coinbase, "TransactionRequestEIP1559", SimpleNamespace)
+        await coinbase_provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a")
+        client = coinbase_provider._client
+        client.evm.send_transaction = AsyncMock(return_value="0xtx")
+        account = client.evm.create_account.return_value
+        abi = [{"type": "function", "name": "approve",
+                "inputs": [{"type": "address"}, {"type": "uint256"}]}]
+
+        await coinbase_provider.get_balances("a")
+        result = await coinbase_provider.execute_contract(
+            "a", "0xUSDC", abi, "approve", ["0x" + "11" * 20, 5]
+        )
+        assert result.tx_hash == "0xtx"
+        await coinbase_provider.get_balances("a")
+        assert account.list_token_balances.await_count == 2
+
+    async def test_balances_scale_atomic_amounts(self, coinbase_provider):
+        await coinbase_provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a")
+        account = coinbase_provider._client.evm.create_account.return_value
+        usdc = SimpleNamespace(contract_address="0xusdc", symbol="usdc")
+        eth = SimpleNamespace(contract_address=None, symbol="ETH")
+        account.list_token_balances.return_value = SimpleNamespace(balances=[
+            SimpleNamespace(token=usdc, amount=SimpleNamespace(amount=1_500_000, decimals=6)),
+            SimpleNamespace(token=eth, amount=Decimal("0.25")),
+        ])
+
+        balances = await coinbase_provider.get_balances("a")
+        assert [(b.token_id, b.token_symbol, b.amount) for b in balances] == [
+            ("0xusdc", "USDC", Decimal("1.5")),
+            ("ETH", "ETH", Decimal("0.25")),
+        ]
+        assert balances[0].raw == {"contract": "0xusdc", "decimals": 6}
+        assert await coinbase_provider.get_raw_balances("a") == (
+            account.list_token_balances.return_value.balances
+        )
+
+    async def test_balances_tolerate_tokens_without_symbol(self, coinbase_provider):
+        await coinbase_provider.create_wallet("ws-1", "BASE-SEPOLIA", name="a")
+        account = coinbase_provider._client.evm.create_account.return_value
+        unlabelled = SimpleNamespace(contract_address="0xnew", symbol=None)
+        account.list_token_balances.return_value = SimpleNamespace(balances=[
+            SimpleNamespace(token=unlabelled, amount=SimpleNamespace(amount=7, decimals=0)),
+        ])
+
+        balances = await coinbase_provider.get_balances("a")
+        assert [(b.token_id, b.token_symbol, b.amount) for b in balances] == [
+            ("0xnew", "", Decimal("7")),
+        ]
+
+    def test_network_name_conversion(self, coinbase_provider):
+        from paykit.providers.coinbase import BLOCKCHAIN_MAPPING, COINBASE_TO_STANDARD
+
+        to_net = coinbase_provider._to_coinbase_network
+        from_net = coinbase_provider._from_coinbase_network
+        for name in ("BASE-SEPOLIA", "base-sepolia", "Base-Sepolia"):
+            assert to_net(name) == "base-sepolia"
+        assert to_net("Optimism") == "optimism"
+        for network in ("solana-devnet", "SOLANA-DEVNET", "Solana-Devnet"):
+            assert from_net(network) == "SOL-DEVNET"
+        assert from_net("optimism") == "OPTIMISM"
+
+        with pytest.raises(TypeError):
+            BLOCKCHAIN_MAPPING["OP"] = "optimism"
+        with pytest.raises(TypeError):
+            COINBASE_TO_STANDARD["optimism"] = "OP"
+
+    def test_to_atomic_truncates_dust(self):
+        from paykit.providers.coinbase import _to_atomic
+
+        assert _to_atomic(Decimal("2"), 10**18) == 2 * 10**18
+        assert _to_atomic(Decimal("1E+2"), 10**6) == 100_000_000
+        assert _to_atomic(Decimal("0.0000019"), 10**6) == 1
+        assert _to_atomic(Decimal("1.123456789123456789"), 10**18) == 1_123456789_123456789
+
+    def test_map_blockchain_type(self):
+        from paykit.providers.coinbase import _map_blockchain_type
+
+        for name in ("SOL", "sol-devnet", "solana", "Solana-Devnet"):
+            assert _map_blockchain_type(name) == "solana"
+        for name in ("BASE-SEPOLIA", "ethereum", "polygon"):
+            assert _map_blockchain_type(name) == "evm"